@@ -1,9 +1,11 @@
+import threading
 from tkinter import Tk, ttk
 from expense_tracker.gui.main_window import MainWindow
 
 from expense_tracker.version import versions
 from expense_tracker.utils.path import get_database_path
 from expense_tracker.utils.migration import migrate_legacy_databases
+from expense_tracker.core.connection import close_shared_connections
 from expense_tracker.core.merchant_repository import MerchantCategoryRepository
 from expense_tracker.core.transaction_repository import TransactionRepository
 from expense_tracker.services.merchant import MerchantCategoryService
@@ -16,23 +18,6 @@ def main():
 
     versions()
 
-    # Migrate legacy databases if they exist
-    migrate_legacy_databases()
-
-    # Use platform-specific data directory for databases
-    print("Using data directory for databases.")
-    print(f" - Transactions DB: {get_database_path('transactions.db')}")
-    print(f" - Merchant Categories DB: {get_database_path('merchant_categories.db')}")
-    transaction_repo = TransactionRepository(str(get_database_path("transactions.db")))
-    merchant_repo = MerchantCategoryRepository(
-        str(get_database_path("merchant_categories.db"))
-    )
-    merchant_service = MerchantCategoryService(
-        merchant_repo, transaction_repo, normalize_merchant
-    )
-    transaction_service = TransactionService(transaction_repo, merchant_service)
-    statistics_service = StatisticsService(transaction_repo)
-
     root = Tk()
     root.title("Expense Tracker")
     root.geometry("1200x700")
@@ -42,6 +27,41 @@ def main():
         tb.Style("darkly")
     except Exception:
         ttk.Style()
-    MainWindow(root, transaction_repo, transaction_service, statistics_service)
-    root.focus_force()
+
+    # Paint the window first; migration and database setup happen after.
+    loading_label = ttk.Label(root, text="Loading...")
+    loading_label.pack(expand=True)
+
+    def _finish_init():
+        loading_label.destroy()
+
+        # Use platform-specific data directory for databases
+        print("Using data directory for databases.")
+        print(f" - Transactions DB: {get_database_path('transactions.db')}")
+        print(f" - Merchant Categories DB: {get_database_path('merchant_categories.db')}")
+        transaction_repo = TransactionRepository(str(get_database_path("transactions.db")))
+        merchant_repo = MerchantCategoryRepository(
+            str(get_database_path("merchant_categories.db"))
+        )
+        merchant_service = MerchantCategoryService(
+            merchant_repo, transaction_repo, normalize_merchant
+        )
+        transaction_service = TransactionService(transaction_repo, merchant_service)
+        statistics_service = StatisticsService(transaction_repo)
+
+        MainWindow(root, transaction_repo, transaction_service, statistics_service)
+        root.focus_force()
+
+    def _startup_tasks():
+        """Runs off the Tk thread; hands control back via after()."""
+        try:
+            # Migrate legacy databases if they exist
+            migrate_legacy_databases()
+        finally:
+            root.after(0, _finish_init)
+
+    root.after(
+        50, lambda: threading.Thread(target=_startup_tasks, daemon=True).start()
+    )
     root.mainloop()
+    close_shared_connections()
@@ -0,0 +1,70 @@
+import os
+import sqlite3
+import threading
+
+# Shared file connections keyed by absolute path; see get_connection.
+_shared_connections: dict[str, sqlite3.Connection] = {}
+_shared_lock = threading.Lock()
+
+
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Returns a tuned SQLite connection for the given database path.
+
+    File databases share one connection per path for the life of the process,
+    so every repository opened on the same file reuses a warm page cache.
+    Shared connections must not be closed by their holders; call
+    close_shared_connections() instead.
+    In-memory databases are private to their connection and always get a new one.
+    """
+    if db_path == ":memory:":
+        return _connect(db_path)
+    db_path = os.path.abspath(db_path)
+    with _shared_lock:
+        conn = _shared_connections.get(db_path)
+        if conn is None:
+            conn = _shared_connections[db_path] = _connect(db_path)
+    return conn
+
+
+def open_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Returns a new tuned connection that is never shared, e.g. for reads on a
+    worker thread. The caller owns it and is responsible for closing it.
+    """
+    return _connect(db_path)
+
+
+def close_shared_connections() -> None:
+    """Closes every shared file connection and forgets them."""
+    with _shared_lock:
+        connections = list(_shared_connections.values())
+        _shared_connections.clear()
+    for conn in connections:
+        conn.close()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    # A larger statement cache keeps every repository query prepared.
+    # Autocommit mode: single statements commit on their own and multi-row
+    # writes open BEGIN IMMEDIATE explicitly, so the module's implicit
+    # BEGIN bookkeeping is skipped.
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        cached_statements=256,
+        isolation_level=None,
+    )
+    conn.row_factory = sqlite3.Row
+    # WAL is meaningless for in-memory databases, so only the
+    # connection-level tuning is applied there.
+    if db_path != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript("""
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-64000;
+        PRAGMA mmap_size=268435456;
+        PRAGMA busy_timeout=5000;
+    """)
+    return conn
@@ -1,28 +1,51 @@
+import json
 import logging
 import sqlite3
+import sys
+from collections import OrderedDict
 
+from expense_tracker.core.connection import get_connection
 from expense_tracker.core.models import MerchantCategory
 
 logger = logging.getLogger(__name__)
 
+# Most exact-match lookups (hits and misses) kept per repository
+CATEGORY_CACHE_SIZE = 4096
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS merchant_categories (
+        merchant_key TEXT PRIMARY KEY,
+        category TEXT NOT NULL
+    );
+"""
+
+
 class MerchantCategoryRepository:
     """
     A repository for managing merchant categories.
     """
 
     def __init__(self, db_path: str):
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = get_connection(db_path)
+        # Recent exact-match lookups keyed by merchant_key, least recent first;
+        # kept in step by set_category and capped at CATEGORY_CACHE_SIZE.
+        self._category_cache: OrderedDict[str, MerchantCategory | None] = (
+            OrderedDict()
+        )
+        # Full merchant table keyed by merchant_key; built on first use.
+        self._all_cache: dict[str, MerchantCategory] | None = None
+        # Merchant keys for fuzzy matching; only new keys invalidate it.
+        self._keys_cache: tuple[str, ...] | None = None
+        # Merchant keys grouped by their first word; rebuilt with _keys_cache.
+        self._first_token_cache: dict[str, tuple[str, ...]] | None = None
         self._init_schema()
+        # Every repository on this file shares the connection, so its
+        # total_changes counter sees writes made through any of them.
+        self._cache_version = self.conn.total_changes
         logger.info("Initialized merchant category database schema")
 
     def _init_schema(self) -> None:
-        self.conn.executescript("""
-            CREATE TABLE IF NOT EXISTS merchant_categories (
-                merchant_key TEXT PRIMARY KEY,
-                category TEXT NOT NULL
-            );
-        """)
+        self.conn.executescript(SCHEMA_SQL)
 
     def _row_to_merchant_category(
         self, row: sqlite3.Row | None
@@ -34,8 +57,27 @@ class MerchantCategoryRepository:
             category=row["category"],
         )
 
+    def _sync_caches(self) -> None:
+        """Drops every cache if the database changed since they were filled."""
+        if self.conn.total_changes != self._cache_version:
+            self._category_cache.clear()
+            self._all_cache = None
+            self._keys_cache = None
+            self._first_token_cache = None
+            self._cache_version = self.conn.total_changes
+
+    def _cache_category(
+        self, merchant_key: str, merchant_category: MerchantCategory | None
+    ) -> None:
+        """Caches one lookup result, evicting the least recently used entry."""
+        self._category_cache[merchant_key] = merchant_category
+        self._category_cache.move_to_end(merchant_key)
+        if len(self._category_cache) > CATEGORY_CACHE_SIZE:
+            self._category_cache.popitem(last=False)
+
     def set_category(self, merchant_category: MerchantCategory) -> None:
         """Sets or updates the category for a given merchant key."""
+        self._sync_caches()
         self.conn.execute(
             """
             INSERT INTO merchant_categories (merchant_key, category)
@@ -45,20 +87,98 @@ class MerchantCategoryRepository:
             (merchant_category.merchant_key, merchant_category.category),
         )
         self.conn.commit()
+        cached = MerchantCategory(
+            merchant_category.merchant_key, merchant_category.category
+        )
+        if self._category_cache.get(cached.merchant_key) is None:
+            self._keys_cache = None
+            self._first_token_cache = None
+        self._cache_category(cached.merchant_key, cached)
+        if self._all_cache is not None:
+            self._all_cache[cached.merchant_key] = cached
+        # The caches now include this write
+        self._cache_version = self.conn.total_changes
 
     def get_category(self, merchant_key: str) -> MerchantCategory | None:
         """Retrieves the category for a given merchant key."""
+        self._sync_caches()
+        if merchant_key in self._category_cache:
+            self._category_cache.move_to_end(merchant_key)
+            return self._category_cache[merchant_key]
         row = self.conn.execute(
             "SELECT * FROM merchant_categories WHERE merchant_key = ?", (merchant_key,)
         )
-        return self._row_to_merchant_category(row.fetchone())
-
-    def get_all_merchants(self) -> list[MerchantCategory]:
-        """Retrieves all merchant categories."""
-        rows = self.conn.execute("SELECT * FROM merchant_categories")
-        merchants = []
-        for row in rows.fetchall():
-            merchant = self._row_to_merchant_category(row)
-            if merchant:
-                merchants.append(merchant)
-        return merchants
+        merchant_category = self._row_to_merchant_category(row.fetchone())
+        self._cache_category(merchant_key, merchant_category)
+        return merchant_category
+
+    def get_categories(
+        self, merchant_keys: list[str]
+    ) -> dict[str, MerchantCategory | None]:
+        """Retrieves the categories for many merchant keys in one query."""
+        self._sync_caches()
+        result: dict[str, MerchantCategory | None] = {}
+        missing = []
+        for key in merchant_keys:
+            if key in self._category_cache:
+                self._category_cache.move_to_end(key)
+                result[key] = self._category_cache[key]
+            else:
+                missing.append(key)
+        if missing:
+            # The keys travel as one JSON parameter, so there is no
+            # bound-variable limit on how many are looked up at once
+            rows = self.conn.execute(
+                """
+                SELECT merchant_key, category FROM merchant_categories
+                WHERE merchant_key IN (SELECT value FROM json_each(?))
+                """,
+                (json.dumps(missing),),
+            )
+            found = {row["merchant_key"]: row["category"] for row in rows}
+            for key in missing:
+                category = found.get(key)
+                result[key] = (
+                    None if category is None else MerchantCategory(key, category)
+                )
+                self._cache_category(key, result[key])
+        # Keep the caller's key order
+        return {key: result[key] for key in merchant_keys}
+
+    def get_all_merchants(self) -> dict[str, MerchantCategory]:
+        """Retrieves all merchant categories keyed by merchant key."""
+        self._sync_caches()
+        if self._all_cache is None:
+            rows = self.conn.execute(
+                "SELECT merchant_key, category FROM merchant_categories"
+            )
+            self._all_cache = {
+                row["merchant_key"]: MerchantCategory(
+                    merchant_key=row["merchant_key"], category=row["category"]
+                )
+                for row in rows
+            }
+        return dict(self._all_cache)
+
+    def get_merchant_keys(self) -> tuple[str, ...]:
+        """Retrieves all merchant keys, cached until a new merchant is added."""
+        self._sync_caches()
+        if self._keys_cache is None:
+            rows = self.conn.execute("SELECT merchant_key FROM merchant_categories")
+            # Interned so the matched key hits the category cache by identity
+            self._keys_cache = tuple(sys.intern(row["merchant_key"]) for row in rows)
+        return self._keys_cache
+
+    def get_merchant_keys_by_first_token(self, token: str) -> tuple[str, ...]:
+        """Retrieves the merchant keys whose first word is token."""
+        self._sync_caches()
+        if self._first_token_cache is None:
+            index: dict[str, list[str]] = {}
+            for key in self.get_merchant_keys():
+                words = key.split(maxsplit=1)
+                if words:
+                    index.setdefault(words[0], []).append(key)
+            self._first_token_cache = {
+                first: tuple(keys) for first, keys in index.items()
+            }
+        return self._first_token_cache.get(token, ())
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import date
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     id: int | None
     date: date
@@ -11,7 +11,7 @@ class Transaction:
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MerchantCategory:
     merchant_key: str
     category: str
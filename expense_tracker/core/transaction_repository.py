@@ -1,34 +1,325 @@
 import logging
 import sqlite3
+import threading
 from dataclasses import replace
 from datetime import date
+from typing import Any, Callable
 
+from expense_tracker.core.connection import get_connection, open_connection
 from expense_tracker.core.models import Transaction
 
 logger = logging.getLogger(__name__)
 
+TRANSACTION_COLUMNS = "id, date, amount, category, description"
+
+INSERT_TRANSACTION_SQL = """
+    INSERT INTO transactions (date, amount, category, description)
+    VALUES (?, ?, ?, ?)
+"""
+
+INSERT_TRANSACTION_RETURNING_SQL = INSERT_TRANSACTION_SQL + "RETURNING id"
+
+TRANSACTION_EXISTS_SQL = (
+    "SELECT 1 FROM transactions WHERE date = ? AND amount = ? AND description = ? LIMIT 1"
+)
+
+TRANSACTIONS_PAGE_SQL = (
+    f"SELECT {TRANSACTION_COLUMNS} FROM transactions "
+    "ORDER BY date DESC, id DESC LIMIT ? OFFSET ?"
+)
+
+TRANSACTIONS_FIRST_PAGE_SQL = (
+    f"SELECT {TRANSACTION_COLUMNS} FROM transactions "
+    "ORDER BY date DESC, id DESC LIMIT ?"
+)
+
+TRANSACTIONS_AFTER_SQL = f"""
+    SELECT {TRANSACTION_COLUMNS} FROM transactions
+    WHERE (date, id) < (?, ?)
+    ORDER BY date DESC, id DESC
+    LIMIT ?
+"""
+
+TRANSACTIONS_BY_CATEGORY_SQL = (
+    f"SELECT {TRANSACTION_COLUMNS} FROM transactions WHERE category = ? "
+    "ORDER BY date DESC LIMIT ? OFFSET ?"
+)
+
+TRANSACTIONS_FOR_DATE_SQL = (
+    f"SELECT {TRANSACTION_COLUMNS} FROM transactions WHERE date = ? ORDER BY amount ASC"
+)
+
+# Batch inserts of at least this many rows may refresh planner statistics
+ANALYZE_MIN_ROWS = 100
+# Rows sampled per index when those statistics are refreshed
+ANALYZE_SAMPLE_ROWS = 400
+
+SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS transactions (
+        id INTEGER PRIMARY KEY,
+        date TEXT NOT NULL,
+        amount REAL NOT NULL,
+        category TEXT NOT NULL DEFAULT 'Uncategorized',
+        description TEXT
+    );
+    CREATE INDEX IF NOT EXISTS ix_tx_date_id ON transactions(date DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS ix_tx_cat_date ON transactions(category, date DESC);
+    CREATE INDEX IF NOT EXISTS ix_tx_expense_date
+        ON transactions(date, category, amount) WHERE amount < 0;
+"""
+
+DAILY_SUMMARY_SQL = """
+    SELECT category, SUM(amount) as total
+    FROM transactions
+    WHERE date = ?
+    GROUP BY category
+"""
+
+DAILY_SPENDING_RANGE_SQL = """
+    SELECT CAST(substr(date, 9, 2) AS INTEGER) as day,
+           SUM(ABS(amount)) as total
+    FROM transactions
+    WHERE date >= ? AND date < ?
+      AND amount < 0
+    GROUP BY day
+"""
+
+MONTHLY_METRICS_SQL = """
+    SELECT SUM(CASE WHEN date >= :start AND date < :end THEN amount END),
+           SUM(CASE WHEN date >= :start AND date < :end AND amount < 0
+                    THEN -amount END),
+           COUNT(CASE WHEN date >= :start AND date < :end THEN 1 END),
+           SUM(CASE WHEN date >= :prev_start AND date < :prev_end AND amount < 0
+                    THEN -amount END)
+    FROM transactions
+    WHERE (date >= :start AND date < :end)
+       OR (date >= :prev_start AND date < :prev_end)
+"""
+
+MONTHLY_TOTALS_RANGE_SQL = """
+    SELECT year_month,
+           SUM(amount),
+           SUM(CASE WHEN amount < 0 THEN -amount END),
+           COUNT(*)
+    FROM transactions
+    WHERE date >= ? AND date < ?
+    GROUP BY year_month
+"""
+
+TOP_CATEGORY_BY_MONTH_SQL = """
+    SELECT year_month, category, total
+    FROM (
+        SELECT year_month, category, SUM(ABS(amount)) as total,
+               ROW_NUMBER() OVER (
+                   PARTITION BY year_month ORDER BY SUM(ABS(amount)) DESC, category
+               ) as rank
+        FROM transactions
+        WHERE date >= ? AND date < ?
+          AND amount < 0
+        GROUP BY year_month, category
+    )
+    WHERE rank = 1
+"""
+
 
 class TransactionRepository:
     """
     A repository for managing transaction data.
     """
 
-    def __init__(self, db_path: str):
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+    def __init__(self, db_path: str, shared: bool = True):
+        """
+        Opens the repository on the shared connection for db_path, or on a
+        private connection owned by this repository when shared is False.
+        """
+        self.db_path = db_path
+        self._owns_conn = not shared
+        self.conn = get_connection(db_path) if shared else open_connection(db_path)
+        # Month lookups and the row count scan the whole table; cache them
+        # until the database changes. Entries are tagged with _data_version(),
+        # so writes through any repository sharing the connection, or commits
+        # from another connection, invalidate them.
+        self._scan_cache: dict[str, Any] = {}
+        self._scan_cache_version: tuple[int, int] | None = None
+        self._scan_cache_lock = threading.Lock()
         self._init_schema()
         logger.info("Initialized database schema")
 
+    def open_reader(self) -> "TransactionRepository":
+        """
+        Returns a repository on its own connection for reads from a worker
+        thread, so they never share the writer's connection or caches.
+        An in-memory database exists only on its own connection, so it
+        returns self.
+        """
+        if self.db_path == ":memory:":
+            return self
+        return TransactionRepository(self.db_path, shared=False)
+
+    def close(self) -> None:
+        """Closes the connection if this repository owns it."""
+        if self._owns_conn:
+            self.conn.close()
+
     def _init_schema(self) -> None:
-        self.conn.executescript("""
-        CREATE TABLE IF NOT EXISTS transactions (
-            id INTEGER PRIMARY KEY,
-            date TEXT NOT NULL,
-            amount REAL NOT NULL,
-            category TEXT NOT NULL DEFAULT 'Uncategorized',
-            description TEXT
-        );
-        """)
+        self.conn.executescript(SCHEMA_SQL)
+        self._add_year_month_column()
+        self._fts_enabled = self._init_search_index()
+        self._analyze_once()
+
+    def _add_year_month_column(self) -> None:
+        """
+        Add a generated 'YYYY-MM' column so monthly grouping reads an index
+        instead of running strftime() over every row. SQLite can only add
+        VIRTUAL generated columns to an existing table; the index stores the
+        computed values.
+        """
+        columns = {
+            row["name"]
+            for row in self.conn.execute("PRAGMA table_xinfo(transactions)")
+        }
+        if "year_month" not in columns:
+            self.conn.execute(
+                """
+                ALTER TABLE transactions ADD COLUMN year_month TEXT
+                GENERATED ALWAYS AS (substr(date, 1, 7)) VIRTUAL
+                """
+            )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_tx_ym ON transactions(year_month, amount)"
+        )
+        self.conn.commit()
+
+    def _init_search_index(self) -> bool:
+        """
+        Mirror descriptions into an FTS5 trigram index so keyword search is an
+        index lookup instead of a LIKE scan over every row. Returns False when
+        the SQLite build lacks FTS5, in which case search falls back to LIKE.
+        """
+        existed = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'transactions_fts'"
+        ).fetchone()
+        try:
+            self.conn.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS transactions_fts USING fts5(
+                description,
+                content='transactions',
+                content_rowid='id',
+                tokenize='trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN
+                INSERT INTO transactions_fts(rowid, description)
+                VALUES (new.id, new.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN
+                INSERT INTO transactions_fts(transactions_fts, rowid, description)
+                VALUES ('delete', old.id, old.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS transactions_fts_au AFTER UPDATE OF description ON transactions BEGIN
+                INSERT INTO transactions_fts(transactions_fts, rowid, description)
+                VALUES ('delete', old.id, old.description);
+                INSERT INTO transactions_fts(rowid, description)
+                VALUES (new.id, new.description);
+            END;
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, keyword search will scan: {e}")
+            return False
+
+        if existed is None:
+            # Index rows that were stored before the FTS table existed
+            self.conn.execute(
+                "INSERT INTO transactions_fts(transactions_fts) VALUES ('rebuild')"
+            )
+            self.conn.commit()
+        return True
+
+    def _keyword_filter(self, keyword: str) -> tuple[str, tuple]:
+        """
+        Returns a WHERE fragment and its parameters matching descriptions that
+        contain the keyword (case-insensitive).
+        """
+        # Trigram MATCH needs at least three characters; shorter keywords scan.
+        if self._fts_enabled and len(keyword) >= 3:
+            phrase = '"' + keyword.replace('"', '""') + '"'
+            return (
+                "id IN (SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH ?)",
+                (phrase,),
+            )
+        # Escape LIKE wildcards so both paths match the keyword literally
+        escaped = (
+            keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        return "description LIKE ? COLLATE NOCASE ESCAPE '\\'", (f"%{escaped}%",)
+
+    def _analyze_once(self) -> None:
+        """Collect planner statistics the first time the database is opened."""
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+        ).fetchone()
+        if has_stats is None:
+            self.conn.execute("ANALYZE")
+            self.conn.commit()
+
+    def _refresh_stats_after_insert(self, inserted: int) -> None:
+        """
+        Re-collect planner statistics after a batch insert that at least
+        doubles the rows they were collected from, e.g. the first import into
+        a database that _analyze_once analyzed while empty. Smaller batches
+        leave the statistics alone.
+        """
+        if inserted < ANALYZE_MIN_ROWS:
+            return
+        row = self.conn.execute(
+            "SELECT stat FROM sqlite_stat1 WHERE idx = 'ix_tx_date_id'"
+        ).fetchone()
+        analyzed_rows = int(row[0].split()[0]) if row else 0
+        if inserted < analyzed_rows:
+            return
+        # Sample each index instead of scanning it fully; the limit is reset
+        # so later ANALYZE runs on this shared connection stay exact.
+        self.conn.execute(f"PRAGMA analysis_limit={ANALYZE_SAMPLE_ROWS}")
+        try:
+            self.conn.execute("ANALYZE transactions")
+        finally:
+            self.conn.execute("PRAGMA analysis_limit=0")
+
+    def _invalidate_caches(self) -> None:
+        with self._scan_cache_lock:
+            self._scan_cache.clear()
+            self._scan_cache_version = None
+
+    def _data_version(self) -> tuple[int, int]:
+        """
+        Returns a token that changes whenever the database may have changed:
+        total_changes counts writes made on this connection, and data_version
+        counts commits made by other connections.
+        """
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return self.conn.total_changes, data_version
+
+    def _cached_scan(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the cached value for key, computing it on a miss. None results
+        are not cached. The version is read before the query runs, so a result
+        that raced with a write is stored under the old version and discarded
+        on the next lookup.
+        """
+        version = self._data_version()
+        with self._scan_cache_lock:
+            if version != self._scan_cache_version:
+                self._scan_cache.clear()
+                self._scan_cache_version = version
+            cached = self._scan_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = compute()
+        if result is not None:
+            with self._scan_cache_lock:
+                if version == self._scan_cache_version:
+                    self._scan_cache[key] = result
+        return result
 
     def _row_to_transaction(self, row: sqlite3.Row | None) -> Transaction | None:
         if row is None:
@@ -41,12 +332,38 @@ class TransactionRepository:
             description=row["description"] or "",
         )
 
+    def _tuple_cursor(self) -> sqlite3.Cursor:
+        """
+        Returns a cursor yielding plain tuples instead of sqlite3.Row.
+        """
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
+
+    def _fetch_transactions(
+        self, query: str, params: tuple | list = ()
+    ) -> list[Transaction]:
+        """
+        Runs a query selecting TRANSACTION_COLUMNS and builds the Transaction list.
+        Rows come back as plain tuples and are indexed positionally, which skips
+        the per-column name lookup of sqlite3.Row on these list-rendering paths.
+        """
+        cursor = self._tuple_cursor()
+        fromisoformat = date.fromisoformat
+        return [
+            Transaction(
+                id=r[0],
+                date=fromisoformat(r[1]),
+                amount=r[2],
+                category=r[3],
+                description=r[4] or "",
+            )
+            for r in cursor.execute(query, params)
+        ]
+
     def add_transaction(self, transaction: Transaction) -> Transaction:
         cursor = self.conn.execute(
-            """
-            INSERT INTO transactions (date, amount, category, description)
-            VALUES (?, ?, ?, ?)
-            """,
+            INSERT_TRANSACTION_SQL,
             (
                 transaction.date.isoformat(),
                 transaction.amount,
@@ -55,8 +372,69 @@ class TransactionRepository:
             ),
         )
         self.conn.commit()
+        self._invalidate_caches()
         return replace(transaction, id=cursor.lastrowid)
 
+    def add_transactions_bulk(
+        self, transactions: list[Transaction], categories: list[str] | None = None
+    ) -> int:
+        """
+        Inserts many transactions inside a single write transaction and
+        returns the number of rows inserted. If categories is given, it
+        replaces each transaction's category without copying the objects.
+        """
+        if not transactions:
+            return 0
+
+        if categories is None:
+            rows = [
+                (t.date.isoformat(), t.amount, t.category, t.description)
+                for t in transactions
+            ]
+        else:
+            rows = [
+                (t.date.isoformat(), t.amount, category, t.description)
+                for t, category in zip(transactions, categories, strict=True)
+            ]
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.executemany(INSERT_TRANSACTION_SQL, rows)
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self._refresh_stats_after_insert(len(rows))
+        self._invalidate_caches()
+        return cursor.rowcount
+
+    def add_many(self, transactions: list[Transaction]) -> list[int]:
+        """
+        Inserts many transactions inside a single write transaction and
+        returns their new ids in input order.
+        """
+        if not transactions:
+            return []
+
+        cursor = self._tuple_cursor()
+        ids: list[int] = []
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # One cached statement rebound per row; RETURNING hands back the id
+            for t in transactions:
+                cursor.execute(
+                    INSERT_TRANSACTION_RETURNING_SQL,
+                    (t.date.isoformat(), t.amount, t.category, t.description),
+                )
+                ids.append(cursor.fetchone()[0])
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self._refresh_stats_after_insert(len(ids))
+        self._invalidate_caches()
+        return ids
+
     def get_transaction(self, transaction_id: int) -> Transaction | None:
         row = self.conn.execute(
             "SELECT * FROM transactions WHERE id = ?", (transaction_id,)
@@ -66,32 +444,29 @@ class TransactionRepository:
     def get_all_transactions(
         self, limit: int = 100, offset: int = 0
     ) -> list[Transaction]:
-        rows = self.conn.execute(
-            "SELECT * FROM transactions ORDER BY date DESC LIMIT ? OFFSET ?",
-            (limit, offset),
+        return self._fetch_transactions(
+            TRANSACTIONS_PAGE_SQL, (limit, offset)
         )
-        transactions: list[Transaction] = []
-        for row in rows.fetchall():
-            transaction = self._row_to_transaction(row)
-            if transaction:
-                transactions.append(transaction)
-        return transactions
-
-    def get_all_transactions_by_category(self, category: str) -> list[Transaction]:
-        rows = self.conn.execute(
-            "SELECT * FROM transactions WHERE category = ? ORDER BY date DESC",
-            (category,),
+
+    def get_all_transactions_by_category(
+        self, category: str, limit: int | None = None, offset: int = 0
+    ) -> list[Transaction]:
+        """
+        Returns transactions in the category ordered by date descending.
+        Returns every match when limit is None; ix_tx_cat_date serves both the
+        filter and the order, so a page costs no sort.
+        """
+        # SQLite treats a negative LIMIT as unlimited
+        return self._fetch_transactions(
+            TRANSACTIONS_BY_CATEGORY_SQL,
+            (category, -1 if limit is None else limit, offset),
         )
-        transactions: list[Transaction] = []
-        for row in rows.fetchall():
-            transaction = self._row_to_transaction(row)
-            if transaction:
-                transactions.append(transaction)
-        return transactions
 
     def count_all_transactions(self) -> int:
-        row = self.conn.execute("SELECT COUNT(*) FROM transactions")
-        return row.fetchone()[0]
+        return self._cached_scan(
+            "count",
+            lambda: self.conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0],
+        )
 
     def search_by_keyword(
         self, keyword: str | None, limit: int = 100, offset: int = 0
@@ -103,16 +478,60 @@ class TransactionRepository:
         if not keyword:
             return self.get_all_transactions(limit, offset)
 
-        rows = self.conn.execute(
-            "SELECT * FROM transactions WHERE description LIKE ? COLLATE NOCASE ORDER BY date DESC LIMIT ? OFFSET ?",
-            (f"%{keyword}%", limit, offset),
+        where, params = self._keyword_filter(keyword)
+        return self._fetch_transactions(
+            f"SELECT {TRANSACTION_COLUMNS} FROM transactions WHERE {where} ORDER BY date DESC, id DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        )
+
+    def get_transactions_after(
+        self, last_date: str | None, last_id: int | None, limit: int = 100
+    ) -> list[Transaction]:
+        """
+        Keyset pagination over all transactions ordered by date and id descending.
+        Returns the page that follows the (last_date, last_id) row, or the first
+        page when no cursor is given.
+        """
+        if last_date is None or last_id is None:
+            return self._fetch_transactions(TRANSACTIONS_FIRST_PAGE_SQL, (limit,))
+        return self._fetch_transactions(
+            TRANSACTIONS_AFTER_SQL, (last_date, last_id, limit)
+        )
+
+    def search_by_keyword_after(
+        self,
+        keyword: str | None,
+        last_date: str | None,
+        last_id: int | None,
+        limit: int = 100,
+    ) -> list[Transaction]:
+        """
+        Keyset pagination over transactions whose description matches the keyword.
+        Returns all transactions if keyword is None or empty.
+        """
+        if not keyword:
+            return self.get_transactions_after(last_date, last_id, limit)
+
+        where, params = self._keyword_filter(keyword)
+        if last_date is None or last_id is None:
+            return self._fetch_transactions(
+                f"""
+                SELECT {TRANSACTION_COLUMNS} FROM transactions
+                WHERE {where}
+                ORDER BY date DESC, id DESC
+                LIMIT ?
+                """,
+                (*params, limit),
+            )
+        return self._fetch_transactions(
+            f"""
+            SELECT {TRANSACTION_COLUMNS} FROM transactions
+            WHERE (date, id) < (?, ?) AND {where}
+            ORDER BY date DESC, id DESC
+            LIMIT ?
+            """,
+            (last_date, last_id, *params, limit),
         )
-        transactions: list[Transaction] = []
-        for row in rows.fetchall():
-            transaction = self._row_to_transaction(row)
-            if transaction:
-                transactions.append(transaction)
-        return transactions
 
     def count_search_results(self, keyword: str | None) -> int:
         """
@@ -122,99 +541,135 @@ class TransactionRepository:
         if not keyword:
             return self.count_all_transactions()
 
+        where, params = self._keyword_filter(keyword)
         row = self.conn.execute(
-            "SELECT COUNT(*) FROM transactions WHERE description LIKE ? COLLATE NOCASE",
-            (f"%{keyword}%",),
+            f"SELECT COUNT(*) FROM transactions WHERE {where}",
+            params,
         )
         return row.fetchone()[0]
 
-    def daily_summary(self, date: str):
-        rows = self.conn.execute(
-            """
-        SELECT category, SUM(amount) as total
-        FROM transactions
-        WHERE date = ?
-        GROUP BY category
-        """,
-            (date,),
-        )
+    def daily_summary(self, date: str) -> list[tuple[str, float]]:
+        """
+        Returns (category, total) pairs for the given ISO date.
+        """
+        rows = self._tuple_cursor().execute(DAILY_SUMMARY_SQL, (date,))
         return rows.fetchall()
 
     def delete_transaction(self, transaction_id: int) -> None:
         self.conn.execute("DELETE FROM transactions WHERE id = ?", (transaction_id,))
         self.conn.commit()
+        self._invalidate_caches()
 
     def delete_multiple_transactions(self, transaction_ids: list[int]) -> int:
+        """
+        Deletes the given transactions and returns how many rows were removed.
+        Missing or repeated ids do not count.
+        """
         if not transaction_ids:
             return 0
 
-        placeholders = ", ".join("?" for _ in transaction_ids)
-        query = f"DELETE FROM transactions WHERE id IN ({placeholders})"
-        cursor = self.conn.execute(query, transaction_ids)
+        # One prepared statement reused for every id, inside a single write
+        # transaction; unlike an IN (...) list this has no bound-variable limit.
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.conn.executemany(
+                "DELETE FROM transactions WHERE id = ?",
+                [(transaction_id,) for transaction_id in transaction_ids],
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
         self.conn.commit()
+        self._invalidate_caches()
+        # rowcount sums direct deletions only, excluding search-index triggers
         return cursor.rowcount
 
-    def update_transaction(self, transaction_id: int, data: dict) -> None:
+    @staticmethod
+    def _build_update(transaction_id: int, data: dict) -> tuple[str, list[object]]:
         """
-        Updates a transaction in the database.
+        Builds the UPDATE statement and its parameters for the given columns.
+        Columns are sorted so the same set of keys always yields the same SQL
+        text and hits the connection's prepared statement cache.
         """
-        updates = ", ".join(f"{key} = ?" for key in data.keys())
+        keys = sorted(data)
+        updates = ", ".join(f"{key} = ?" for key in keys)
         values: list[object] = []
-        for key, value in data.items():
+        for key in keys:
+            value = data[key]
             if key == "date" and isinstance(value, date):
                 values.append(value.isoformat())
             else:
                 values.append(value)
         values.append(transaction_id)
-        query = f"UPDATE transactions SET {updates} WHERE id = ?"
+        return f"UPDATE transactions SET {updates} WHERE id = ?", values
+
+    def update_transaction(self, transaction_id: int, data: dict) -> None:
+        """
+        Updates a transaction in the database.
+        """
+        query, values = self._build_update(transaction_id, data)
         self.conn.execute(query, values)
         self.conn.commit()
+        self._invalidate_caches()
+
+    def bulk_update(self, pairs: list[tuple[int, dict]]) -> None:
+        """
+        Applies many transaction updates inside a single write transaction,
+        so the whole batch costs one commit instead of one per row.
+        """
+        if not pairs:
+            return
+
+        # Group updates touching the same columns so each group shares one
+        # prepared statement.
+        groups: dict[str, list[list[object]]] = {}
+        for transaction_id, data in pairs:
+            query, values = self._build_update(transaction_id, data)
+            groups.setdefault(query, []).append(values)
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for query, rows in groups.items():
+                self.conn.executemany(query, rows)
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        self._invalidate_caches()
 
     def get_daily_spending_range(self, start_date: date, end_date: date) -> dict[int, float]:
         """
         Returns a dictionary mapping day-of-month (1-31) to total spending.
         Only includes expenses (negative amounts).
         """
-        rows = self.conn.execute(
-            """
-            SELECT CAST(strftime('%d', date) AS INTEGER) as day,
-                   SUM(ABS(amount)) as total
-            FROM transactions
-            WHERE date >= ? AND date < ?
-              AND amount < 0
-            GROUP BY day
-            """,
+        rows = self._tuple_cursor().execute(
+            DAILY_SPENDING_RANGE_SQL,
             (start_date.isoformat(), end_date.isoformat()),
         )
+        return dict(rows)
 
-        result: dict[int, float] = {}
-        for row in rows.fetchall():
-            result[row["day"]] = row["total"]
-        return result
-    
     def get_monthly_cashflow_trend(self, num_months: int) -> list[tuple[int, int, float]]:
         """
         Returns a list of (year, month, net_amount) tuples for the past num_months.
         Net amount is total income minus total expenses for each month.
         Ordered by year and month ascending.
         """
-        rows = self.conn.execute(
+        rows = self._tuple_cursor().execute(
             """
-            SELECT 
-                CAST(strftime('%Y', date) AS INTEGER) as year,
-                CAST(strftime('%m', date) AS INTEGER) as month,
-                SUM(amount) as net_amount
+            SELECT year_month, SUM(amount) as net_amount
             FROM transactions
-            GROUP BY year, month
-            ORDER BY year DESC, month DESC
+            GROUP BY year_month
+            ORDER BY year_month DESC
             LIMIT ?
             """,
             (num_months,),
         )
 
-        result: list[tuple[int, int, float]] = []
-        for row in reversed(rows.fetchall()):
-            result.append((row["year"], row["month"], row["net_amount"]))
+        result = [
+            (int(year_month[:4]), int(year_month[5:7]), net_amount)
+            for year_month, net_amount in rows
+        ]
+        result.reverse()
         return result
 
     def get_monthly_net_income(self, start_date: date, end_date: date) -> float:
@@ -239,58 +694,42 @@ class TransactionRepository:
         Query transactions matching exact date.
         Order by amount DESC (largest expenses first).
         """
-        rows = self.conn.execute(
-            "SELECT * FROM transactions WHERE date = ? ORDER BY amount ASC",
-            (target_date.isoformat(),),
+        return self._fetch_transactions(
+            TRANSACTIONS_FOR_DATE_SQL, (target_date.isoformat(),)
         )
-        transactions: list[Transaction] = []
-        for row in rows.fetchall():
-            transaction = self._row_to_transaction(row)
-            if transaction:
-                transactions.append(transaction)
-        return transactions
-    
+
     def get_latest_month_with_data(self) -> tuple[int, int]:
         """
         Get the most recent month that has transaction data.
         Falls back to current month if no transactions exist.
         """
-        # Query for all months with transactions (ordered by most recent first)
-        rows = self.conn.execute(
-            """
-            SELECT DISTINCT
-                CAST(strftime('%Y', date) AS INTEGER) as year,
-                CAST(strftime('%m', date) AS INTEGER) as month
-            FROM transactions
-            ORDER BY year DESC, month DESC
-            LIMIT 1
-            """
-        )
-        result = rows.fetchone()
-
+        result = self._cached_scan("latest", self._fetch_latest_month)
         if result is None:
             # No transactions exist, default to current month
             today = date.today()
             return (today.year, today.month)
+        return result
 
-        return (result["year"], result["month"])
-    
+    def _fetch_latest_month(self) -> tuple[int, int] | None:
+        # max(date) is a single descent of the date index; ISO dates sort
+        # chronologically so year and month can be sliced from the string.
+        latest = self.conn.execute("SELECT max(date) FROM transactions").fetchone()[0]
+        if latest is None:
+            return None
+        return (int(latest[:4]), int(latest[5:7]))
 
     def get_all_months_with_data(self) -> set[tuple[int, int]]:
         """
-        Returns a list of (year, month) tuples for all months that have transaction data.
-        Ordered by year and month descending (most recent first).
+        Returns a set of (year, month) tuples for all months that have transaction data.
         """
-        rows = self.conn.execute(
-            """
-            SELECT DISTINCT
-                CAST(strftime('%Y', date) AS INTEGER) as year,
-                CAST(strftime('%m', date) AS INTEGER) as month
-            FROM transactions
-            ORDER BY year DESC, month DESC
-            """
-        )
-        return {(row["year"], row["month"]) for row in rows.fetchall()}
+        return set(self._cached_scan("all", self._fetch_all_months))
+
+    def _fetch_all_months(self) -> set[tuple[int, int]]:
+        rows = self.conn.execute("SELECT DISTINCT year_month FROM transactions")
+        return {
+            (int(row["year_month"][:4]), int(row["year_month"][5:7]))
+            for row in rows.fetchall()
+        }
 
     def get_months_with_expenses(self) -> list[tuple[int, int]]:
         """
@@ -298,21 +737,22 @@ class TransactionRepository:
         Only includes months with negative amounts (expenses).
         Ordered by year and month descending (most recent first).
         """
+        return list(self._cached_scan("expenses", self._fetch_expense_months))
+
+    def _fetch_expense_months(self) -> list[tuple[int, int]]:
         rows = self.conn.execute(
             """
-            SELECT DISTINCT
-                CAST(strftime('%Y', date) AS INTEGER) as year,
-                CAST(strftime('%m', date) AS INTEGER) as month
+            SELECT DISTINCT year_month
             FROM transactions
             WHERE amount < 0
-            ORDER BY year DESC, month DESC
+            ORDER BY year_month DESC
             """
         )
-        result: list[tuple[int, int]] = []
-        for row in rows.fetchall():
-            result.append((row["year"], row["month"]))
-        return result
-    
+        return [
+            (int(row["year_month"][:4]), int(row["year_month"][5:7]))
+            for row in rows.fetchall()
+        ]
+
     def get_daily_spending_for_year(self, year: int) -> dict[str, float]:
         """
         Returns spending keyed by ISO date string for the given year.
@@ -320,7 +760,7 @@ class TransactionRepository:
         """
         start = date(year, 1, 1).isoformat()
         end = date(year + 1, 1, 1).isoformat()
-        rows = self.conn.execute(
+        rows = self._tuple_cursor().execute(
             """
             SELECT date, SUM(ABS(amount)) as total
             FROM transactions
@@ -330,35 +770,66 @@ class TransactionRepository:
             """,
             (start, end),
         )
-        result: dict[str, float] = {}
-        for row in rows.fetchall():
-            result[row["date"]] = row["total"]
-        return result
+        return dict(rows)
 
-    def get_years_with_expenses(self) -> list[int]:
+    def get_daily_spending_series_for_year(self, year: int) -> list[float]:
         """
-        Returns sorted descending list of years that have expense data.
-        Only includes years with negative amounts (expenses).
+        Returns spending for every day of the given year as a list indexed by
+        day offset from Jan 1, with 0.0 for days without expenses.
+        Only includes expenses (negative amounts).
         """
-        rows = self.conn.execute(
+        start = date(year, 1, 1)
+        end = date(year + 1, 1, 1)
+        series = [0.0] * (end - start).days
+        rows = self._tuple_cursor().execute(
             """
-            SELECT DISTINCT CAST(strftime('%Y', date) AS INTEGER) as year
+            SELECT CAST(strftime('%j', date) AS INTEGER) - 1 as day_offset,
+                   SUM(ABS(amount)) as total
             FROM transactions
-            WHERE amount < 0
-            ORDER BY year DESC
-            """
+            WHERE date >= ? AND date < ?
+              AND amount < 0
+            GROUP BY day_offset
+            """,
+            (start.isoformat(), end.isoformat()),
         )
-        return [row["year"] for row in rows.fetchall()]
+        for day_offset, total in rows:
+            series[day_offset] = total
+        return series
+
+    def get_years_with_expenses(self) -> list[int]:
+        """
+        Returns sorted descending list of years that have expense data.
+        Only includes years with negative amounts (expenses).
+        """
+        # Derived from the cached expense months, which are already descending
+        return list(dict.fromkeys(year for year, _ in self.get_months_with_expenses()))
 
     def transaction_exists(self, transaction: Transaction) -> bool:
         """Checks if a transaction with the same date, amount, and description already exists in the database.
         """
         row = self.conn.execute(
-            "SELECT 1 FROM transactions WHERE date = ? AND amount = ? AND description = ?",
+            TRANSACTION_EXISTS_SQL,
             (transaction.date.isoformat(), transaction.amount, transaction.description),
         )
         return row.fetchone() is not None
 
+    def existing_transaction_keys(
+        self, transactions: list[Transaction]
+    ) -> set[tuple[str, float, str]]:
+        """
+        Returns the (date, amount, description) keys of the given transactions that
+        are already stored, using one date-range query instead of one per row.
+        """
+        if not transactions:
+            return set()
+        dates = [t.date.isoformat() for t in transactions]
+        rows = self._tuple_cursor().execute(
+            "SELECT date, amount, description FROM transactions WHERE date BETWEEN ? AND ?",
+            (min(dates), max(dates)),
+        )
+        wanted = {(d, t.amount, t.description) for d, t in zip(dates, transactions)}
+        return {key for key in rows if key in wanted}
+
     def get_spending_by_category(self, start_date: date, end_date: date) -> list[tuple[str, float]]:
         """
         Returns all categories with their total spending, sorted descending by amount.
@@ -377,6 +848,28 @@ class TransactionRepository:
         )
         return [(row["category"], row["total"]) for row in rows.fetchall()]
 
+    def get_top_spending_category(
+        self, start_date: date, end_date: date
+    ) -> tuple[str, float] | None:
+        """
+        Returns the (category, total_spending) with the highest spending in
+        [start_date, end_date), or None when there are no expenses. Ties go to
+        the alphabetically first category.
+        """
+        rows = self._tuple_cursor().execute(
+            """
+            SELECT category, SUM(ABS(amount)) as total
+            FROM transactions
+            WHERE date >= ? AND date < ?
+              AND amount < 0
+            GROUP BY category
+            ORDER BY total DESC, category
+            LIMIT 1
+            """,
+            (start_date.isoformat(), end_date.isoformat()),
+        )
+        return rows.fetchone()
+
     def get_total_expense(self, start_date: date, end_date: date) -> float:
         """
         Get total expenses for a given month.
@@ -407,4 +900,57 @@ class TransactionRepository:
             (start_date.isoformat(), end_date.isoformat()),
         )
         result = row.fetchone()
-        return result["transaction_count"] if result["transaction_count"] is not None else 0
\ No newline at end of file
+        return result["transaction_count"] if result["transaction_count"] is not None else 0
+
+    def get_monthly_metrics_bundle(
+        self, start_date: date, end_date: date, prev_start: date, prev_end: date
+    ) -> tuple[float, float, int, float]:
+        """
+        Returns (net_income, total_expense, transaction_count, prev_total_expense)
+        for [start_date, end_date) and the expenses of [prev_start, prev_end),
+        computed in a single pass with conditional aggregation.
+        """
+        row = self.conn.execute(
+            MONTHLY_METRICS_SQL,
+            {
+                "start": start_date.isoformat(),
+                "end": end_date.isoformat(),
+                "prev_start": prev_start.isoformat(),
+                "prev_end": prev_end.isoformat(),
+            },
+        ).fetchone()
+        net_income, total_expense, transaction_count, prev_total_expense = row
+        return (
+            net_income or 0.0,
+            total_expense or 0.0,
+            transaction_count,
+            prev_total_expense or 0.0,
+        )
+
+    def get_monthly_totals_range(
+        self, start_date: date, end_date: date
+    ) -> dict[str, tuple[float, float, int]]:
+        """
+        Returns {year_month: (net_income, total_expense, transaction_count)}
+        for every month with data in [start_date, end_date), from one grouped query.
+        """
+        rows = self._tuple_cursor().execute(
+            MONTHLY_TOTALS_RANGE_SQL, (start_date.isoformat(), end_date.isoformat())
+        )
+        return {
+            year_month: (net or 0.0, expense or 0.0, count)
+            for year_month, net, expense, count in rows
+        }
+
+    def get_top_category_by_month(
+        self, start_date: date, end_date: date
+    ) -> dict[str, tuple[str, float]]:
+        """
+        Returns {year_month: (category, total_spending)} with the highest-spending
+        category of each month in [start_date, end_date), breaking ties like
+        get_top_spending_category. Only includes expenses (negative amounts).
+        """
+        rows = self._tuple_cursor().execute(
+            TOP_CATEGORY_BY_MONTH_SQL, (start_date.isoformat(), end_date.isoformat())
+        )
+        return {year_month: (category, total) for year_month, category, total in rows}
@@ -1,4 +1,5 @@
 import logging
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -33,7 +34,7 @@ class EditExpenseDialog(tk.Toplevel):
 
         self.prev_data = None
 
-        build_expense_form(
+        form = build_expense_form(
             self,
             self.amount_var,
             self.category_var,
@@ -42,26 +43,71 @@ class EditExpenseDialog(tk.Toplevel):
             on_submit=self._on_save,
             on_cancel=self._on_cancel,
         )
+        # Entries and Save stay disabled until the transaction has loaded, so
+        # an early Save cannot write the blank form over the stored row
+        self._form_inputs = [*form.entries, form.submit_button]
+        self._set_form_enabled(False)
         self.bind("<Escape>", lambda e: self._on_cancel())
 
         self._load_transaction_data()
 
+    def _set_form_enabled(self, enabled: bool):
+        for widget in self._form_inputs:
+            widget.state(["!disabled"] if enabled else ["disabled"])
+
     def _load_transaction_data(self):
-        self.prev_data = self.transaction_service.get_transaction(self.transaction_id)
-        if self.prev_data is not None:
-            self.amount_var.set(str(self.prev_data.amount))
-            self.category_var.set(self.prev_data.category)
-            self.description_var.set(self.prev_data.description)
-
-            # Suggest a better category if currently uncategorized
-            if self.prev_data.category == "Uncategorized":
-                suggested = self.transaction_service.suggest_category(
-                    self.prev_data.description, self.prev_data.amount
-                )
-                if suggested != "Uncategorized":
-                    self.category_var.set(suggested)
+        """Fetch the transaction on a worker thread so the dialog paints immediately."""
+        self.progress_label.config(text="Loading...")
+        self.progress_bar.pack(side="left", fill="x", expand=True, padx=5)
+        self.progress_bar.start()
+        threading.Thread(target=self._fetch_transaction_data, daemon=True).start()
+
+    def _fetch_transaction_data(self):
+        """Runs off the Tk thread; hands the result back via after()."""
+        try:
+            transaction = self.transaction_service.get_transaction(self.transaction_id)
+            result = (transaction, None)
+        except Exception as e:
+            logger.exception("Failed to load transaction %s", self.transaction_id)
+            result = (None, e)
+
+        try:
+            self.after(0, self._apply_transaction_data, *result)
+        except (RuntimeError, tk.TclError):
+            # The dialog was closed before loading finished
+            pass
+
+    def _apply_transaction_data(self, transaction, error):
+        if not self.winfo_exists():
+            return
+        self.progress_bar.stop()
+        self.progress_bar.pack_forget()
+        self.progress_label.config(text="")
+
+        if error is not None or transaction is None:
+            reason = error or f"transaction {self.transaction_id} not found"
+            messagebox.showerror("Error", f"Failed to load transaction: {reason}")
+            self._on_cancel()
+            return
+
+        self.prev_data = transaction
+        self.amount_var.set(str(self.prev_data.amount))
+        self.category_var.set(self.prev_data.category)
+        self.description_var.set(self.prev_data.description)
+
+        # Suggest a better category if currently uncategorized. This runs on
+        # the Tk thread because the merchant caches are not thread-safe.
+        if self.prev_data.category == "Uncategorized":
+            suggested = self.transaction_service.suggest_category(
+                self.prev_data.description, self.prev_data.amount
+            )
+            if suggested != "Uncategorized":
+                self.category_var.set(suggested)
+        self._set_form_enabled(True)
 
     def _on_save(self):
+        if self.prev_data is None:
+            return  # Still loading
         amount = validate_amount(self.amount_var)
         if amount is None:
             return
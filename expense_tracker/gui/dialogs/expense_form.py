@@ -1,6 +1,19 @@
+import re
 import tkinter as tk
+from dataclasses import dataclass
 from tkinter import ttk, messagebox
 
+AMOUNT_RX = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+@dataclass(slots=True)
+class ExpenseForm:
+    """Widgets of a built expense form that callers may need to reach."""
+
+    frame: ttk.Frame
+    entries: list[ttk.Entry]
+    submit_button: ttk.Button
+
 
 def build_expense_form(
     parent: tk.Widget,
@@ -10,38 +23,36 @@ def build_expense_form(
     submit_text: str,
     on_submit,
     on_cancel,
-) -> ttk.Frame:
+) -> ExpenseForm:
     """Build the shared Amount/Category/Description form used by Add and Edit dialogs."""
     frame = ttk.Frame(parent)
     frame.pack(fill="both", padx=10, pady=10)
 
     # Amount
     ttk.Label(frame, text="Amount (e.g. 12.50):").grid(row=0, column=0, sticky="w")
-    ttk.Entry(frame, textvariable=amount_var, width=20).grid(
-        row=1, column=0, sticky="w"
-    )
+    amount_entry = ttk.Entry(frame, textvariable=amount_var, width=20)
+    amount_entry.grid(row=1, column=0, sticky="w")
 
     # Category
     ttk.Label(frame, text="Category:").grid(row=2, column=0, sticky="w")
-    ttk.Entry(frame, textvariable=category_var, width=20).grid(
-        row=3, column=0, sticky="w"
-    )
+    category_entry = ttk.Entry(frame, textvariable=category_var, width=20)
+    category_entry.grid(row=3, column=0, sticky="w")
 
     # Description
     ttk.Label(frame, text="Description:").grid(row=4, column=0, sticky="w")
-    ttk.Entry(frame, textvariable=description_var, width=20).grid(
-        row=5, column=0, sticky="w"
-    )
+    description_entry = ttk.Entry(frame, textvariable=description_var, width=20)
+    description_entry.grid(row=5, column=0, sticky="w")
 
     # Buttons
     button_frame = ttk.Frame(frame)
     button_frame.grid(row=6, column=0, pady=10, sticky="e")
-    ttk.Button(button_frame, text=submit_text, command=on_submit).pack(
-        side="right", padx=5
-    )
+    submit_button = ttk.Button(button_frame, text=submit_text, command=on_submit)
+    submit_button.pack(side="right", padx=5)
     ttk.Button(button_frame, text="Cancel", command=on_cancel).pack(side="right")
 
-    return frame
+    return ExpenseForm(
+        frame, [amount_entry, category_entry, description_entry], submit_button
+    )
 
 
 def validate_amount(amount_var: tk.StringVar) -> float | None:
@@ -50,8 +61,8 @@ def validate_amount(amount_var: tk.StringVar) -> float | None:
     if not raw:
         messagebox.showerror("Error", "Amount is required.")
         return None
-    try:
-        return float(raw)
-    except ValueError:
+    raw = raw.strip()
+    if not AMOUNT_RX.fullmatch(raw):
         messagebox.showerror("Error", "Amount must be a valid number.")
         return None
+    return float(raw)
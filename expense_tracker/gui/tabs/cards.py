@@ -0,0 +1,52 @@
+import tkinter as tk
+from tkinter import font as tkfont
+
+CARD_BG = "#2b2b2b"
+CARD_FG = "#ffffff"
+CARD_MUTED_FG = "#aaaaaa"
+
+FONT_SPECS = {
+    "title": {"family": "Arial", "size": 14, "weight": "bold"},
+    "value": {"family": "Arial", "size": 28, "weight": "bold"},
+    "heading": {"family": "Arial", "size": 24, "weight": "bold"},
+    "sub": {"family": "Arial", "size": 18},
+    "chart": {"family": "Arial", "size": 11},
+    "small": {"family": "Arial", "size": 9},
+    "header": {"family": "Arial", "size": 20, "weight": "bold"},
+    "section": {"family": "Arial", "size": 16, "weight": "bold"},
+    "empty": {"family": "Arial", "size": 16},
+    "chart_empty": {"family": "Arial", "size": 14},
+}
+
+_fonts: dict[str, tkfont.Font] = {}
+
+
+def get_font(name: str) -> tkfont.Font:
+    """Return the shared named font, creating it on first use (needs a Tk root)."""
+    font = _fonts.get(name)
+    if font is None:
+        font = _fonts[name] = tkfont.Font(**FONT_SPECS[name])
+    return font
+
+
+def build_card(parent: tk.Widget, row: int, column: int, title: str) -> tk.Frame:
+    """Build a titled summary card and place it in the parent's grid."""
+    card = tk.Frame(parent, relief=tk.RIDGE, borderwidth=2, bg=CARD_BG)
+    card.grid(row=row, column=column, padx=10, pady=10, sticky="nsew")
+    tk.Label(
+        card, text=title, font=get_font("title"), bg=CARD_BG, fg=CARD_FG
+    ).pack(pady=(20, 10))
+    return card
+
+
+def add_card_value(
+    card: tk.Frame,
+    text: str,
+    font: str = "value",
+    fg: str = CARD_FG,
+    pady: tuple[int, int] = (10, 20),
+) -> tk.Label:
+    """Add a value label to a card and return it for later updates."""
+    label = tk.Label(card, text=text, font=get_font(font), bg=CARD_BG, fg=fg)
+    label.pack(pady=pady)
+    return label
@@ -1,10 +1,22 @@
+import bisect
 import calendar
+import functools
+import logging
+import threading
 import tkinter as tk
-from datetime import date, timedelta
+from datetime import date
 from tkinter import ttk
 
+from expense_tracker.gui.tabs.cards import (
+    CARD_MUTED_FG,
+    add_card_value,
+    build_card,
+    get_font,
+)
 from expense_tracker.services.statistics import StatisticsService
 
+logger = logging.getLogger(__name__)
+
 # GitHub-style green color palette (5 levels)
 COLORS = [
     "#ebedf0",  # no spending
@@ -24,11 +36,29 @@ MONTH_ABBREVS = [
     "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
 ]
 
+# Tooltip names, snapshotted from the locale-aware calendar proxies
+DAY_NAMES = tuple(calendar.day_name)
+MONTH_ABBRS = tuple(calendar.month_abbr)
+
 # Layout constants
 LEFT_MARGIN = 40  # space for day-of-week labels
 TOP_MARGIN = 20   # space for month labels
 
 
+@functools.lru_cache(maxsize=14)
+def _build_offset_grid(jan1_weekday: int, total_days: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Lay out a year as [col][row] -> day offset from Jan 1, or -1 outside the year.
+    Only 14 shapes exist (7 start weekdays x leap or not), so they are cached.
+    """
+    num_cols = (jan1_weekday + total_days - 1) // 7 + 1
+    grid = [[-1] * 7 for _ in range(num_cols)]
+    for day_offset in range(total_days):
+        col, row = divmod(jan1_weekday + day_offset, 7)
+        grid[col][row] = day_offset
+    return tuple(tuple(column) for column in grid)
+
+
 class HeatmapTab(tk.Frame):
     def __init__(self, master, statistics_service: StatisticsService, main_window):
         super().__init__(master)
@@ -37,12 +67,33 @@ class HeatmapTab(tk.Frame):
 
         # State
         self._available_years: list[int] = []
+        self._year_to_idx: dict[int, int] = {}
         self._current_year: int = date.today().year
-        self._spending_data: dict[str, float] = {}
-        self._cell_map: dict[tuple[int, int], date] = {}  # (col, row) -> date
-
-        # Tooltip
-        self._tooltip: tk.Toplevel | None = None
+        # Spending series of years already visited; cleared on refresh
+        self._spending_cache: dict[int, list[float]] = {}
+        self._refresh_generation = 0
+        # Refresh workers read through their own connection, one at a time
+        self._reader_service = statistics_service.open_reader()
+        self._reader_lock = threading.Lock()
+        # [col][row] -> day offset from Jan 1, or -1 outside the year
+        self._offset_grid: tuple[tuple[int, ...], ...] = ()
+        self._jan1_ordinal: int = 0
+        self._daily_spending: list[float] = []
+        self._day_colors: list[str] = []
+
+        # Tooltip: one hidden window reused for every hovered cell
+        self._tooltip = tk.Toplevel(self)
+        self._tooltip.withdraw()
+        self._tooltip.wm_overrideredirect(True)
+        self._tooltip_label = tk.Label(
+            self._tooltip,
+            background="#FFFFE0",
+            relief=tk.SOLID,
+            borderwidth=1,
+            padx=5,
+            pady=3,
+        )
+        self._tooltip_label.pack()
         self._tooltip_cell: tuple[int, int] | None = None
 
         self.pack(fill=tk.BOTH, expand=True)
@@ -51,7 +102,8 @@ class HeatmapTab(tk.Frame):
         self._build_header()
         self._canvas_container = tk.Frame(self)
         self._canvas_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self._canvas: tk.Canvas | None = None
+        self._photo: tk.PhotoImage | None = None
+        self._create_heatmap_widgets()
 
     def _build_header(self):
         """Build header with year navigation controls."""
@@ -63,7 +115,7 @@ class HeatmapTab(tk.Frame):
         )
         self.prev_button.pack(side=tk.LEFT, padx=5)
 
-        self.year_label = ttk.Label(header, text="", font=("Arial", 20, "bold"))
+        self.year_label = ttk.Label(header, text="", font=get_font("header"))
         self.year_label.pack(side=tk.LEFT, expand=True)
 
         self.next_button = ttk.Button(
@@ -81,11 +133,7 @@ class HeatmapTab(tk.Frame):
 
         self.year_label.config(text=str(self._current_year))
 
-        year_idx = (
-            self._available_years.index(self._current_year)
-            if self._current_year in self._available_years
-            else -1
-        )
+        year_idx = self._year_to_idx.get(self._current_year, -1)
         self.prev_button.config(
             state=tk.NORMAL
             if year_idx < len(self._available_years) - 1
@@ -97,56 +145,167 @@ class HeatmapTab(tk.Frame):
 
     def _previous_year(self):
         """Navigate to previous year with expenses."""
-        if self._current_year not in self._available_years:
+        idx = self._year_to_idx.get(self._current_year)
+        if idx is None:
             return
-        idx = self._available_years.index(self._current_year)
         if idx < len(self._available_years) - 1:
             self._current_year = self._available_years[idx + 1]
             self._update_header()
-            self._build_heatmap()
+            self._update_heatmap_data()
 
     def _next_year(self):
         """Navigate to next year with expenses."""
-        if self._current_year not in self._available_years:
+        idx = self._year_to_idx.get(self._current_year)
+        if idx is None:
             return
-        idx = self._available_years.index(self._current_year)
         if idx > 0:
             self._current_year = self._available_years[idx - 1]
             self._update_header()
-            self._build_heatmap()
+            self._update_heatmap_data()
 
     def refresh(self):
-        """Fetch data and rebuild heatmap."""
-        self._available_years = self.statistics_service.get_available_years()
+        """Fetch data on a worker thread, then rebuild the heatmap."""
+        self._refresh_generation += 1
+        self.year_label.config(text="Loading...")
+        threading.Thread(
+            target=self._fetch_refresh_data,
+            args=(self._refresh_generation,),
+            daemon=True,
+        ).start()
+
+    def _fetch_refresh_data(self, generation: int):
+        """Runs off the Tk thread; hands the result back via after()."""
+        try:
+            with self._reader_lock:
+                years = self._reader_service.get_available_years()
+                spending_data = (
+                    self._reader_service.get_yearly_heatmap_series(years[0])
+                    if years
+                    else []
+                )
+            callback = (self._apply_refresh, generation, years, spending_data)
+        except Exception:
+            logger.exception("Failed to load heatmap data")
+            callback = (self._update_header,)
+
+        try:
+            self.after(0, *callback)
+        except (RuntimeError, tk.TclError):
+            # The window was closed before loading finished
+            pass
+
+    def destroy(self):
+        with self._reader_lock:
+            self._reader_service.close()
+        super().destroy()
+
+    def _apply_refresh(
+        self, generation: int, years: list[int], spending_data: list[float]
+    ):
+        if generation != self._refresh_generation:
+            return  # A newer refresh is in flight
+
+        self._spending_cache.clear()
+        self._available_years = years
+        self._year_to_idx = {y: i for i, y in enumerate(self._available_years)}
 
         if self._available_years:
             self._current_year = self._available_years[0]
+            self._spending_cache[self._current_year] = spending_data
         else:
             self._current_year = date.today().year
 
         self._update_header()
-        self._build_heatmap()
+        self._update_heatmap_data()
 
-    def _build_heatmap(self):
-        """Build the GitHub-style heatmap grid."""
-        # Clear existing canvas
-        for widget in self._canvas_container.winfo_children():
-            widget.destroy()
+    def _create_heatmap_widgets(self):
+        """
+        Create the canvas and summary cards once; year changes only update them.
+        """
+        self._empty_label = tk.Label(
+            self._canvas_container,
+            text="No expenses found",
+            font=get_font("empty"),
+            fg="gray",
+        )
 
-        if not self._available_years:
-            message = tk.Label(
-                self._canvas_container,
-                text="No expenses found",
-                font=("Arial", 16),
-                fg="gray",
+        self._canvas = tk.Canvas(self._canvas_container, highlightthickness=0)
+        self._heatmap_item = self._canvas.create_image(
+            LEFT_MARGIN, TOP_MARGIN, anchor=tk.NW
+        )
+
+        # Draw day-of-week labels
+        for row_idx, label in enumerate(DAY_LABELS):
+            if label:
+                y = TOP_MARGIN + row_idx * CELL_STRIDE + CELL_SIZE // 2
+                self._canvas.create_text(
+                    LEFT_MARGIN - 8, y,
+                    text=label,
+                    anchor=tk.E,
+                    font=get_font("small"),
+                    fill="white",
+                )
+
+        # Month labels and legend; positioned per year by the _place_* methods
+        self._month_items = [
+            self._canvas.create_text(
+                0, 0, text=abbrev, anchor=tk.W, font=get_font("small"), fill="white"
             )
-            message.pack(pady=50)
-            return
+            for abbrev in MONTH_ABBREVS
+        ]
+        self._legend_more = self._canvas.create_text(
+            0, 0, text="More", anchor=tk.E, font=get_font("small"), fill="white"
+        )
+        self._legend_boxes = [
+            self._canvas.create_rectangle(0, 0, 0, 0, fill=color, outline="")
+            for color in COLORS
+        ]
+        self._legend_less = self._canvas.create_text(
+            0, 0, text="Less", anchor=tk.E, font=get_font("small"), fill="white"
+        )
+
+        # Bind events
+        self._canvas.bind("<Motion>", self._on_mouse_move)
+        self._canvas.bind("<Leave>", self._on_mouse_leave)
+        self._canvas.bind("<Button-1>", self._on_click)
+        self._canvas.configure(cursor="hand2")
 
-        # Fetch spending data
-        self._spending_data = self.statistics_service.get_yearly_heatmap_data(
-            self._current_year
+        # Summary cards below heatmap
+        self._summary_frame = tk.Frame(self._canvas_container)
+        for col in range(3):
+            self._summary_frame.columnconfigure(col, weight=1)
+        self.total_label = add_card_value(
+            build_card(self._summary_frame, 0, 0, "Total Spent"), ""
         )
+        self.daily_avg_label = add_card_value(
+            build_card(self._summary_frame, 0, 1, "Daily Average"), ""
+        )
+        busiest_card = build_card(self._summary_frame, 0, 2, "Busiest Day")
+        self.busiest_day_label = add_card_value(busiest_card, "", pady=(10, 0))
+        self.busiest_amount_label = add_card_value(
+            busiest_card, "", font="sub", fg=CARD_MUTED_FG, pady=(5, 20)
+        )
+
+    def _update_heatmap_data(self):
+        """Redraw the GitHub-style heatmap grid and summary for the current year."""
+        if not self._available_years:
+            self._canvas.pack_forget()
+            self._summary_frame.pack_forget()
+            self._empty_label.pack(pady=50)
+            return
+
+        self._empty_label.pack_forget()
+        self._canvas.pack(anchor=tk.CENTER)
+        self._summary_frame.pack(fill=tk.X, pady=(10, 0))
+
+        # Fetch spending per day, indexed by day offset from Jan 1
+        daily_spending = self._spending_cache.get(self._current_year)
+        if daily_spending is None:
+            daily_spending = self.statistics_service.get_yearly_heatmap_series(
+                self._current_year
+            )
+            self._spending_cache[self._current_year] = daily_spending
+        self._daily_spending = daily_spending
 
         # Calculate grid layout
         jan1 = date(self._current_year, 1, 1)
@@ -156,16 +315,13 @@ class HeatmapTab(tk.Frame):
         total_days = self._total_days
         num_cols = (jan1_weekday + total_days - 1) // 7 + 1
 
-        # Build cell map
-        self._cell_map = {}
-        for day_offset in range(total_days):
-            d = jan1 + timedelta(days=day_offset)
-            col = (jan1_weekday + day_offset) // 7
-            row = d.weekday()
-            self._cell_map[(col, row)] = d
+        # Offset grid is shared by years with the same shape; dates are
+        # recovered from the ordinal on demand
+        self._jan1_ordinal = jan1.toordinal()
+        self._offset_grid = _build_offset_grid(jan1_weekday, total_days)
 
         # Calculate color thresholds from spending data
-        spending_values = sorted(v for v in self._spending_data.values() if v > 0)
+        spending_values = sorted(v for v in self._daily_spending if v > 0)
         if spending_values:
             n = len(spending_values)
             self._thresholds = [
@@ -176,148 +332,86 @@ class HeatmapTab(tk.Frame):
         else:
             self._thresholds = [0, 0, 0]
 
+        # Cell color per day, indexed by day offset from Jan 1
+        self._day_colors = [self._get_color(v) for v in self._daily_spending]
+
         # Canvas dimensions
         canvas_w = LEFT_MARGIN + num_cols * CELL_STRIDE + 10
         canvas_h = TOP_MARGIN + 7 * CELL_STRIDE + 50  # extra for legend
+        self._canvas.config(width=canvas_w, height=canvas_h)
 
-        self._canvas = tk.Canvas(
-            self._canvas_container,
-            width=canvas_w,
-            height=canvas_h,
-            highlightthickness=0,
-        )
-        self._canvas.pack(anchor=tk.CENTER)
+        # Month labels and legend move with the number of columns
+        self._place_month_labels(jan1, jan1_weekday)
+        self._draw_cells(num_cols)
+        self._place_legend(canvas_w, canvas_h)
 
-        # Draw month labels
-        self._draw_month_labels(jan1, jan1_weekday)
+        self._update_summary_cards()
 
-        # Draw day-of-week labels
-        for row_idx, label in enumerate(DAY_LABELS):
-            if label:
-                y = TOP_MARGIN + row_idx * CELL_STRIDE + CELL_SIZE // 2
-                self._canvas.create_text(
-                    LEFT_MARGIN - 8, y,
-                    text=label,
-                    anchor=tk.E,
-                    font=("Arial", 9),
-                    fill="white",
-                )
+    def _update_summary_cards(self):
+        """Update the yearly summary cards below the heatmap."""
+        daily_spending = self._daily_spending
+        total_spent = sum(daily_spending)
+        daily_avg = total_spent / self._total_days
 
-        # Draw cells
-        for (col, row), d in self._cell_map.items():
-            x = LEFT_MARGIN + col * CELL_STRIDE
-            y = TOP_MARGIN + row * CELL_STRIDE
-            spending = self._spending_data.get(d.isoformat(), 0.0)
-            color = self._get_color(spending)
-
-            self._canvas.create_rectangle(
-                x, y, x + CELL_SIZE, y + CELL_SIZE,
-                fill=color,
-                outline="",
-                tags=f"cell_{col}_{row}",
+        if any(daily_spending):
+            busiest_offset = max(
+                range(len(daily_spending)), key=daily_spending.__getitem__
             )
-
-        # Draw legend
-        self._draw_legend(canvas_w, canvas_h)
-
-        # Build summary cards below heatmap
-        self._build_summary_cards()
-
-        # Bind events
-        self._canvas.bind("<Motion>", self._on_mouse_move)
-        self._canvas.bind("<Leave>", self._on_mouse_leave)
-        self._canvas.bind("<Button-1>", self._on_click)
-        self._canvas.configure(cursor="hand2")
-
-    def _build_summary_cards(self):
-        """Build yearly summary cards below the heatmap."""
-        summary_frame = tk.Frame(self._canvas_container)
-        summary_frame.pack(fill=tk.X, pady=(10, 0))
-        for col in range(3):
-            summary_frame.columnconfigure(col, weight=1)
-
-        # Compute metrics
-        total_spent = sum(self._spending_data.values())
-        daily_avg = total_spent / self._total_days if self._spending_data else 0.0
-
-        if self._spending_data:
-            busiest_key = max(self._spending_data, key=self._spending_data.get)
-            busiest_date = date.fromisoformat(busiest_key)
-            busiest_amount = self._spending_data[busiest_key]
-            busiest_label = busiest_date.strftime("%b %-d")
+            busiest_amount = daily_spending[busiest_offset]
+            busiest_date = date.fromordinal(self._jan1_ordinal + busiest_offset)
+            busiest_text = busiest_date.strftime("%b %-d")
+            busiest_amount_text = f"${busiest_amount:,.2f}"
         else:
-            busiest_label = None
-            busiest_amount = 0.0
-
-        # Card 1: Total Spent
-        card1 = tk.Frame(
-            summary_frame, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
-        )
-        card1.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        tk.Label(
-            card1, text="Total Spent", font=("Arial", 14, "bold"),
-            bg="#2b2b2b", fg="#ffffff",
-        ).pack(pady=(20, 10))
-        tk.Label(
-            card1, text=f"${total_spent:,.2f}", font=("Arial", 28, "bold"),
-            bg="#2b2b2b", fg="#ffffff",
-        ).pack(pady=(10, 20))
-
-        # Card 2: Daily Average
-        card2 = tk.Frame(
-            summary_frame, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
-        )
-        card2.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-        tk.Label(
-            card2, text="Daily Average", font=("Arial", 14, "bold"),
-            bg="#2b2b2b", fg="#ffffff",
-        ).pack(pady=(20, 10))
-        tk.Label(
-            card2, text=f"${daily_avg:,.2f}", font=("Arial", 28, "bold"),
-            bg="#2b2b2b", fg="#ffffff",
-        ).pack(pady=(10, 20))
-
-        # Card 3: Busiest Day
-        card3 = tk.Frame(
-            summary_frame, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
+            busiest_text, busiest_amount_text = "N/A", ""
+
+        # Format everything first, then reconfigure the labels in one pass
+        card_texts = {
+            self.total_label: f"${total_spent:,.2f}",
+            self.daily_avg_label: f"${daily_avg:,.2f}",
+            self.busiest_day_label: busiest_text,
+            self.busiest_amount_label: busiest_amount_text,
+        }
+        for label, text in card_texts.items():
+            label.config(text=text)
+
+    def _draw_cells(self, num_cols: int):
+        """
+        Paint all day cells into one PhotoImage shown as a single canvas item.
+        Each grid row is sent as one line of pixel data that Tk tiles down the
+        cell height, so a full year costs seven put() calls.
+        """
+        r, g, b = self._canvas.winfo_rgb(self._canvas.cget("background"))
+        bg = f"#{r >> 8:02x}{g >> 8:02x}{b >> 8:02x}"
+        gap = " ".join([bg] * CELL_GAP)
+        width = num_cols * CELL_STRIDE - CELL_GAP
+
+        self._photo = tk.PhotoImage(
+            master=self._canvas, width=width, height=7 * CELL_STRIDE - CELL_GAP
         )
-        card3.grid(row=0, column=2, padx=10, pady=10, sticky="nsew")
-        tk.Label(
-            card3, text="Busiest Day", font=("Arial", 14, "bold"),
-            bg="#2b2b2b", fg="#ffffff",
-        ).pack(pady=(20, 10))
-        if busiest_label:
-            tk.Label(
-                card3, text=busiest_label, font=("Arial", 28, "bold"),
-                bg="#2b2b2b", fg="#ffffff",
-            ).pack(pady=(10, 0))
-            tk.Label(
-                card3, text=f"${busiest_amount:,.2f}", font=("Arial", 18),
-                bg="#2b2b2b", fg="#aaaaaa",
-            ).pack(pady=(5, 20))
-        else:
-            tk.Label(
-                card3, text="N/A", font=("Arial", 28, "bold"),
-                bg="#2b2b2b", fg="#ffffff",
-            ).pack(pady=(10, 20))
-
-    def _draw_month_labels(self, jan1: date, jan1_weekday: int):
-        """Draw month abbreviation labels along the top."""
-        for month_num in range(1, 13):
+        for row in range(7):
+            cells = []
+            for col in range(num_cols):
+                day_offset = self._offset_grid[col][row]
+                color = bg if day_offset < 0 else self._day_colors[day_offset]
+                cells.append(" ".join([color] * CELL_SIZE))
+            y = row * CELL_STRIDE
+            self._photo.put(
+                "{" + f" {gap} ".join(cells) + "}",
+                to=(0, y, width, y + CELL_SIZE),
+            )
+
+        self._canvas.itemconfig(self._heatmap_item, image=self._photo)
+
+    def _place_month_labels(self, jan1: date, jan1_weekday: int):
+        """Move the month abbreviation labels above each month's first column."""
+        for month_num, item in enumerate(self._month_items, start=1):
             first_of_month = date(self._current_year, month_num, 1)
             day_offset = (first_of_month - jan1).days
             col = (jan1_weekday + day_offset) // 7
-            x = LEFT_MARGIN + col * CELL_STRIDE
-            self._canvas.create_text(
-                x, TOP_MARGIN - 8,
-                text=MONTH_ABBREVS[month_num - 1],
-                anchor=tk.W,
-                font=("Arial", 9),
-                fill="white",
-            )
+            self._canvas.coords(item, LEFT_MARGIN + col * CELL_STRIDE, TOP_MARGIN - 8)
 
-    def _draw_legend(self, canvas_w: int, canvas_h: int):
-        """Draw the Less/More legend at the bottom-right."""
+    def _place_legend(self, canvas_w: int, canvas_h: int):
+        """Move the Less/More legend to the bottom-right."""
         legend_y = canvas_h - 25
         legend_right = canvas_w - 10
         box_size = 12
@@ -325,57 +419,39 @@ class HeatmapTab(tk.Frame):
         total_boxes_w = len(COLORS) * (box_size + box_gap)
 
         # "More" label
-        self._canvas.create_text(
-            legend_right, legend_y + box_size // 2,
-            text="More",
-            anchor=tk.E,
-            font=("Arial", 9),
-            fill="white",
-        )
+        self._canvas.coords(self._legend_more, legend_right, legend_y + box_size // 2)
 
         # Color boxes (right to left)
         box_start_x = legend_right - 35 - total_boxes_w
-        for i, color in enumerate(COLORS):
+        for i, item in enumerate(self._legend_boxes):
             x = box_start_x + i * (box_size + box_gap)
-            self._canvas.create_rectangle(
-                x, legend_y, x + box_size, legend_y + box_size,
-                fill=color,
-                outline="",
-            )
+            self._canvas.coords(item, x, legend_y, x + box_size, legend_y + box_size)
 
         # "Less" label
-        self._canvas.create_text(
-            box_start_x - 5, legend_y + box_size // 2,
-            text="Less",
-            anchor=tk.E,
-            font=("Arial", 9),
-            fill="white",
-        )
+        self._canvas.coords(self._legend_less, box_start_x - 5, legend_y + box_size // 2)
 
     def _get_color(self, spending: float) -> str:
         """Get the GitHub-style green color for a spending amount."""
         if spending <= 0:
             return COLORS[0]
-        if spending <= self._thresholds[0]:
-            return COLORS[1]
-        if spending <= self._thresholds[1]:
-            return COLORS[2]
-        if spending <= self._thresholds[2]:
-            return COLORS[3]
-        return COLORS[4]
+        # Thresholds are inclusive upper bounds, hence bisect_left
+        return COLORS[1 + bisect.bisect_left(self._thresholds, spending)]
 
     def _coords_to_cell(self, x: int, y: int) -> tuple[int, int] | None:
         """Convert canvas coordinates to (col, row) grid position."""
-        col = (x - LEFT_MARGIN) // CELL_STRIDE
-        row = (y - TOP_MARGIN) // CELL_STRIDE
+        # Most motion events land outside the grid; reject them up front
+        if x < LEFT_MARGIN or y < TOP_MARGIN:
+            return None
+        col, cell_x = divmod(x - LEFT_MARGIN, CELL_STRIDE)
+        row, cell_y = divmod(y - TOP_MARGIN, CELL_STRIDE)
 
         # Check if click is within a cell (not in gap)
-        cell_x = (x - LEFT_MARGIN) % CELL_STRIDE
-        cell_y = (y - TOP_MARGIN) % CELL_STRIDE
+        if row >= 7 or col >= len(self._offset_grid):
+            return None
         if cell_x >= CELL_SIZE or cell_y >= CELL_SIZE:
             return None
 
-        if (col, row) in self._cell_map:
+        if self._offset_grid[col][row] >= 0:
             return (col, row)
         return None
 
@@ -387,32 +463,23 @@ class HeatmapTab(tk.Frame):
             return  # Still in same cell, no update needed
 
         self._tooltip_cell = cell
-        self._hide_tooltip()
 
         if cell is None:
+            self._hide_tooltip()
             return
 
-        d = self._cell_map[cell]
-        spending = self._spending_data.get(d.isoformat(), 0.0)
+        col, row = cell
+        day_offset = self._offset_grid[col][row]
+        d = date.fromordinal(self._jan1_ordinal + day_offset)
+        spending = self._daily_spending[day_offset]
 
-        day_name = calendar.day_name[d.weekday()]
-        month_name = calendar.month_abbr[d.month]
+        day_name = DAY_NAMES[d.weekday()]
+        month_name = MONTH_ABBRS[d.month]
         tooltip_text = f"${spending:.2f} on {day_name}, {month_name} {d.day}, {d.year}"
 
-        self._tooltip = tk.Toplevel(self)
-        self._tooltip.wm_overrideredirect(True)
+        self._tooltip_label.config(text=tooltip_text)
         self._tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
-
-        label = tk.Label(
-            self._tooltip,
-            text=tooltip_text,
-            background="#FFFFE0",
-            relief=tk.SOLID,
-            borderwidth=1,
-            padx=5,
-            pady=3,
-        )
-        label.pack()
+        self._tooltip.deiconify()
 
     def _on_mouse_leave(self, event):
         """Handle mouse leaving the canvas."""
@@ -421,9 +488,7 @@ class HeatmapTab(tk.Frame):
 
     def _hide_tooltip(self):
         """Hide the tooltip."""
-        if self._tooltip:
-            self._tooltip.destroy()
-            self._tooltip = None
+        self._tooltip.withdraw()
 
     def _on_click(self, event):
         """Handle click on a day cell."""
@@ -431,5 +496,6 @@ class HeatmapTab(tk.Frame):
         if cell is None:
             return
 
-        clicked_date = self._cell_map[cell]
+        col, row = cell
+        clicked_date = date.fromordinal(self._jan1_ordinal + self._offset_grid[col][row])
         self.main_window.show_transactions_for_date(clicked_date)
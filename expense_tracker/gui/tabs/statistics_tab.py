@@ -1,9 +1,24 @@
 import calendar
+import logging
 import platform
+import threading
 import tkinter as tk
 from tkinter import ttk
 
-from expense_tracker.services.statistics import StatisticsService
+from expense_tracker.gui.tabs.cards import (
+    CARD_FG,
+    CARD_MUTED_FG,
+    add_card_value,
+    build_card,
+    get_font,
+)
+from expense_tracker.services.statistics import MonthlyMetrics, StatisticsService
+
+logger = logging.getLogger(__name__)
+
+# Months of metrics loaded per refresh, ending at the displayed month, so
+# stepping back through recent months needs no further queries
+METRICS_PREFETCH_MONTHS = 12
 
 
 class StatisticsTab(tk.Frame):
@@ -17,7 +32,15 @@ class StatisticsTab(tk.Frame):
         self._current_month = latest_month
 
         # Cache all months with data for navigation button state management
-        self._months_with_data = self.statistics_service.get_available_months()
+        self._months_with_data = set(self.statistics_service.get_available_months())
+
+        # Metrics and category breakdowns of months already visited; cleared on refresh
+        self._metrics_cache: dict[tuple[int, int], MonthlyMetrics] = {}
+        self._breakdown_cache: dict[tuple[int, int], list[tuple[str, float]]] = {}
+        self._refresh_generation = 0
+        # Refresh workers read through their own connection, one at a time
+        self._reader_service = statistics_service.open_reader()
+        self._reader_lock = threading.Lock()
 
         self.pack(fill=tk.BOTH, expand=True)
 
@@ -101,7 +124,7 @@ class StatisticsTab(tk.Frame):
         self.prev_button.pack(side=tk.LEFT, padx=5)
 
         # Month/Year label
-        self.month_label = ttk.Label(header, text="", font=("Arial", 20, "bold"))
+        self.month_label = ttk.Label(header, text="", font=get_font("header"))
         self.month_label.pack(side=tk.LEFT, expand=True)
 
         # Next month button
@@ -124,152 +147,34 @@ class StatisticsTab(tk.Frame):
         for row in range(2):
             cards_container.grid_rowconfigure(row, weight=1)
 
-        # Row 0, Col 0: Net Income Card
-        net_income_card = tk.Frame(
-            cards_container, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
-        )
-        net_income_card.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(
-            net_income_card,
-            text="Monthly Net Income",
-            font=("Arial", 14, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        ).pack(pady=(20, 10))
-
-        self.net_income_label = tk.Label(
-            net_income_card,
-            text="$0.00",
-            font=("Arial", 28, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
+        self.net_income_label = add_card_value(
+            build_card(cards_container, 0, 0, "Monthly Net Income"), "$0.00"
         )
-        self.net_income_label.pack(pady=(10, 20))
 
-        # Row 0, Col 1: Top Spending Category Card
-        top_category_card = tk.Frame(
-            cards_container, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
+        top_category_card = build_card(cards_container, 0, 1, "Top Spending Category")
+        self.top_category_name_label = add_card_value(
+            top_category_card, "N/A", font="heading", pady=(5, 5)
         )
-        top_category_card.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(
-            top_category_card,
-            text="Top Spending Category",
-            font=("Arial", 14, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        ).pack(pady=(20, 10))
-
-        self.top_category_name_label = tk.Label(
+        self.top_category_amount_label = add_card_value(
             top_category_card,
-            text="N/A",
-            font=("Arial", 24, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
+            "$0.00",
+            font="sub",
+            fg=CARD_MUTED_FG,
+            pady=(5, 20),
         )
-        self.top_category_name_label.pack(pady=(5, 5))
 
-        self.top_category_amount_label = tk.Label(
-            top_category_card,
-            text="$0.00",
-            font=("Arial", 18),
-            bg="#2b2b2b",
-            fg="#aaaaaa",
+        self.total_expenses_label = add_card_value(
+            build_card(cards_container, 0, 2, "Total Expenses"), "$0.00"
         )
-        self.top_category_amount_label.pack(pady=(5, 20))
-
-        # Row 0, Col 2: Total Expenses Card
-        total_expenses_card = tk.Frame(
-            cards_container, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
+        self.txn_count_label = add_card_value(
+            build_card(cards_container, 1, 0, "Transactions"), "0"
         )
-        total_expenses_card.grid(row=0, column=2, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(
-            total_expenses_card,
-            text="Total Expenses",
-            font=("Arial", 14, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        ).pack(pady=(20, 10))
-
-        self.total_expenses_label = tk.Label(
-            total_expenses_card,
-            text="$0.00",
-            font=("Arial", 28, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
+        self.avg_txn_label = add_card_value(
+            build_card(cards_container, 1, 1, "Avg Transaction"), "$0.00"
         )
-        self.total_expenses_label.pack(pady=(10, 20))
-
-        # Row 1, Col 0: Transaction Count Card
-        txn_count_card = tk.Frame(
-            cards_container, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
+        self.mom_label = add_card_value(
+            build_card(cards_container, 1, 2, "vs. Last Month"), "N/A"
         )
-        txn_count_card.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(
-            txn_count_card,
-            text="Transactions",
-            font=("Arial", 14, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        ).pack(pady=(20, 10))
-
-        self.txn_count_label = tk.Label(
-            txn_count_card,
-            text="0",
-            font=("Arial", 28, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        )
-        self.txn_count_label.pack(pady=(10, 20))
-
-        # Row 1, Col 1: Average Transaction Card
-        avg_txn_card = tk.Frame(
-            cards_container, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
-        )
-        avg_txn_card.grid(row=1, column=1, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(
-            avg_txn_card,
-            text="Avg Transaction",
-            font=("Arial", 14, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        ).pack(pady=(20, 10))
-
-        self.avg_txn_label = tk.Label(
-            avg_txn_card,
-            text="$0.00",
-            font=("Arial", 28, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        )
-        self.avg_txn_label.pack(pady=(10, 20))
-
-        # Row 1, Col 2: Month-over-Month Card
-        mom_card = tk.Frame(
-            cards_container, relief=tk.RIDGE, borderwidth=2, bg="#2b2b2b"
-        )
-        mom_card.grid(row=1, column=2, padx=10, pady=10, sticky="nsew")
-
-        tk.Label(
-            mom_card,
-            text="vs. Last Month",
-            font=("Arial", 14, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        ).pack(pady=(20, 10))
-
-        self.mom_label = tk.Label(
-            mom_card,
-            text="N/A",
-            font=("Arial", 28, "bold"),
-            bg="#2b2b2b",
-            fg="#ffffff",
-        )
-        self.mom_label.pack(pady=(10, 20))
 
     def _build_category_chart(self):
         """Build the category spending bar chart section below cards."""
@@ -277,7 +182,7 @@ class StatisticsTab(tk.Frame):
         tk.Label(
             self._content_frame,
             text="Spending by Category",
-            font=("Arial", 16, "bold"),
+            font=get_font("section"),
             fg="#ffffff",
             anchor="w",
         ).pack(fill=tk.X, padx=20, pady=(10, 5))
@@ -300,9 +205,11 @@ class StatisticsTab(tk.Frame):
         if canvas_width <= 1:
             return
 
-        breakdown = self.statistics_service.get_monthly_category_breakdown(
-            self._current_year, self._current_month
-        )
+        key = (self._current_year, self._current_month)
+        breakdown = self._breakdown_cache.get(key)
+        if breakdown is None:
+            breakdown = self.statistics_service.get_monthly_category_breakdown(*key)
+            self._breakdown_cache[key] = breakdown
 
         label_margin = 150
         right_margin = 80
@@ -319,7 +226,7 @@ class StatisticsTab(tk.Frame):
                 empty_height / 2,
                 text="No expenses this month",
                 fill="#aaaaaa",
-                font=("Arial", 14),
+                font=get_font("chart_empty"),
             )
             return
 
@@ -341,7 +248,7 @@ class StatisticsTab(tk.Frame):
                 y + bar_height / 2,
                 text=category,
                 fill="#ffffff",
-                font=("Arial", 11),
+                font=get_font("chart"),
                 anchor="e",
             )
 
@@ -363,7 +270,7 @@ class StatisticsTab(tk.Frame):
                 y + bar_height / 2,
                 text=f"${amount:,.2f}",
                 fill="#ffffff",
-                font=("Arial", 11),
+                font=get_font("chart"),
                 anchor="w",
             )
 
@@ -426,9 +333,11 @@ class StatisticsTab(tk.Frame):
     def _update_metrics(self):
         """Update metric displays with current month data."""
         # Get monthly metrics from statistics service
-        metrics = self.statistics_service.get_monthly_metrics(
-            self._current_year, self._current_month
-        )
+        key = (self._current_year, self._current_month)
+        metrics = self._metrics_cache.get(key)
+        if metrics is None:
+            metrics = self.statistics_service.get_monthly_metrics(*key)
+            self._metrics_cache[key] = metrics
 
         # Format and color code net income
         formatted_income = f"${abs(metrics.net_income):,.2f}"
@@ -440,41 +349,96 @@ class StatisticsTab(tk.Frame):
         else:
             color = "#ffffff"  # White for zero
 
-        self.net_income_label.config(text=formatted_income, fg=color)
-
-        # Display top spending category
+        # Top spending category
         if metrics.top_category is None:
-            self.top_category_name_label.config(text="N/A")
-            self.top_category_amount_label.config(text="$0.00")
+            top_name, top_amount = "N/A", 0.0
         else:
-            self.top_category_name_label.config(text=metrics.top_category)
-            self.top_category_amount_label.config(
-                text=f"${metrics.top_category_spending:,.2f}"
-            )
-
-        # Total Expenses
-        self.total_expenses_label.config(text=f"${metrics.total_expenses:,.2f}")
-
-        # Transaction Count
-        self.txn_count_label.config(text=str(metrics.transaction_count))
-
-        # Average Transaction
-        self.avg_txn_label.config(text=f"${metrics.avg_transaction:,.2f}")
+            top_name, top_amount = metrics.top_category, metrics.top_category_spending
 
         # Month-over-Month
-        if metrics.month_over_month_pct is None:
-            self.mom_label.config(text="N/A", fg="#ffffff")
+        pct = metrics.month_over_month_pct
+        if pct is None:
+            mom_text, mom_color = "N/A", "#ffffff"
+        elif pct > 0:
+            mom_text, mom_color = f"+{pct:.1f}%", "#ff4444"  # Red: spending increased
+        elif pct < 0:
+            mom_text, mom_color = f"{pct:.1f}%", "#44ff44"  # Green: spending decreased
         else:
-            pct = metrics.month_over_month_pct
-            if pct > 0:
-                self.mom_label.config(text=f"+{pct:.1f}%", fg="#ff4444")  # Red: spending increased
-            elif pct < 0:
-                self.mom_label.config(text=f"{pct:.1f}%", fg="#44ff44")  # Green: spending decreased
-            else:
-                self.mom_label.config(text="0.0%", fg="#ffffff")
+            mom_text, mom_color = "0.0%", "#ffffff"
+
+        # Format everything first, then reconfigure the labels in one pass
+        # and let Tk run a single geometry pass for the whole batch
+        card_updates = [
+            (self.net_income_label, formatted_income, color),
+            (self.top_category_name_label, top_name, CARD_FG),
+            (self.top_category_amount_label, f"${top_amount:,.2f}", CARD_MUTED_FG),
+            (self.total_expenses_label, f"${metrics.total_expenses:,.2f}", CARD_FG),
+            (self.txn_count_label, str(metrics.transaction_count), CARD_FG),
+            (self.avg_txn_label, f"${metrics.avg_transaction:,.2f}", CARD_FG),
+            (self.mom_label, mom_text, mom_color),
+        ]
+        for label, text, fg in card_updates:
+            label.configure(text=text, fg=fg)
+        self.update_idletasks()
 
         self._draw_category_chart()
 
     def refresh(self):
-        """Refresh statistics when tab becomes active."""
+        """Refresh statistics on a worker thread when tab becomes active."""
+        self._refresh_generation += 1
+        self.month_label.config(text="Loading...")
+        threading.Thread(
+            target=self._fetch_refresh_data,
+            args=(self._refresh_generation, self._current_year, self._current_month),
+            daemon=True,
+        ).start()
+
+    def _fetch_refresh_data(self, generation: int, year: int, month: int):
+        """Runs off the Tk thread; hands the result back via after()."""
+        try:
+            with self._reader_lock:
+                months = set(self._reader_service.get_available_months())
+                metrics = {
+                    (m.year, m.month): m
+                    for m in self._reader_service.get_monthly_metrics_range(
+                        year, month, METRICS_PREFETCH_MONTHS
+                    )
+                }
+                breakdown = self._reader_service.get_monthly_category_breakdown(
+                    year, month
+                )
+            callback = (
+                self._apply_refresh, generation, (year, month), months, metrics, breakdown
+            )
+        except Exception:
+            logger.exception("Failed to load statistics")
+            callback = (self._update_header_label,)
+
+        try:
+            self.after(0, *callback)
+        except (RuntimeError, tk.TclError):
+            # The window was closed before loading finished
+            pass
+
+    def destroy(self):
+        with self._reader_lock:
+            self._reader_service.close()
+        super().destroy()
+
+    def _apply_refresh(
+        self,
+        generation: int,
+        key: tuple[int, int],
+        months: set[tuple[int, int]],
+        metrics: dict[tuple[int, int], MonthlyMetrics],
+        breakdown: list[tuple[str, float]],
+    ):
+        if generation != self._refresh_generation:
+            return  # A newer refresh is in flight
+
+        self._metrics_cache = metrics
+        self._breakdown_cache.clear()
+        self._breakdown_cache[key] = breakdown
+        self._months_with_data = months
+        self._update_header_label()
         self._update_metrics()
@@ -24,6 +24,9 @@ class TransactionsTab(tk.Frame):
         self.main_window = main_window
         self._current_page = 0
         self._page_size = 100
+        # Keyset cursors: the (date, id) of the last row on each previous page
+        self._page_cursors: list[tuple[str, int] | None] = [None]
+        self._last_row_key: tuple[str, int] | None = None
         self._total_transactions = 0
         self._search_keyword: str | None = None
         self._filter_date: date | None = None
@@ -74,17 +77,27 @@ class TransactionsTab(tk.Frame):
     def _previous_page(self):
         if self._current_page > 0:
             self._current_page -= 1
+            self._page_cursors.pop()
             self.refresh()
 
     def _next_page(self):
+        if self._last_row_key is None:
+            return
+        self._page_cursors.append(self._last_row_key)
         self._current_page += 1
         self.refresh()
 
+    def _reset_pagination(self):
+        self._current_page = 0
+        self._page_cursors = [None]
+
     def refresh(self):
         for row in self.tree.get_children():
             self.tree.delete(row)
 
         offset = self._current_page * self._page_size
+        cursor = self._page_cursors[self._current_page]
+        last_date, last_id = cursor if cursor else (None, None)
 
         # Use date filter if active, otherwise use search/all transactions
         if self._filter_date:
@@ -99,17 +112,19 @@ class TransactionsTab(tk.Frame):
             self._total_transactions = self.transaction_repo.count_search_results(
                 self._search_keyword
             )
-            transactions = self.transaction_repo.search_by_keyword(
+            transactions = self.transaction_repo.search_by_keyword_after(
                 self._search_keyword,
+                last_date,
+                last_id,
                 limit=self._page_size,
-                offset=offset,
             )
             self.search_indicator.config(text=f"Search: {self._search_keyword}")
         else:
             self._total_transactions = self.transaction_repo.count_all_transactions()
-            transactions = self.transaction_repo.get_all_transactions(
+            transactions = self.transaction_repo.get_transactions_after(
+                last_date,
+                last_id,
                 limit=self._page_size,
-                offset=offset,
             )
             self.search_indicator.config(text="")
 
@@ -126,6 +141,12 @@ class TransactionsTab(tk.Frame):
                 ),
             )
 
+        self._last_row_key = (
+            (transactions[-1].date.isoformat(), transactions[-1].id)
+            if transactions
+            else None
+        )
+
         total_pages = (
             math.ceil(self._total_transactions / self._page_size)
             if self._total_transactions > 0
@@ -236,14 +257,14 @@ class TransactionsTab(tk.Frame):
             return
 
         self._search_keyword = keyword
-        self._current_page = 0  # Reset to first page
+        self._reset_pagination()  # Reset to first page
         self.refresh()
 
     def _clear_search(self):
         self._search_keyword = None
         self._filter_date = None  # Also clear date filter
         self.qvar.set("")  # Clear the search entry field
-        self._current_page = 0  # Reset to first page
+        self._reset_pagination()  # Reset to first page
         self.refresh()
 
     def filter_by_date(self, target_date: date):
@@ -251,5 +272,5 @@ class TransactionsTab(tk.Frame):
         self._filter_date = target_date
         self._search_keyword = None  # Clear search when filtering by date
         self.qvar.set("")  # Clear the search entry field
-        self._current_page = 0  # Reset to first page
+        self._reset_pagination()  # Reset to first page
         self.refresh()
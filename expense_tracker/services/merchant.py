@@ -1,6 +1,9 @@
 from typing import Callable
+import functools
 import logging
 
+from rapidfuzz import fuzz, process
+
 from expense_tracker.core.transaction_repository import TransactionRepository
 from expense_tracker.core.merchant_repository import MerchantCategoryRepository
 from expense_tracker.core.models import MerchantCategory
@@ -18,7 +21,8 @@ class MerchantCategoryService:
     ):
         self.merchant_repo = merchant_repo
         self.transaction_repo = transaction_repo
-        self.normalizer = normalizer
+        # Normalization is pure, so repeated descriptions reuse the first result
+        self.normalizer = functools.lru_cache(maxsize=4096)(normalizer)
 
     def update_category(self, description: str, category: str) -> None:
         """Updates the category for a given merchant description."""
@@ -29,6 +33,9 @@ class MerchantCategoryService:
     def fuzzy_lookup_merchant(self, merchant: str, threshold: int = 90) -> str | None:
         """Attempts to find the closest matching merchant name using fuzzy string matching.
 
+        The query and the stored keys are already normalized, so they are compared
+        as-is (rapidfuzz's default). Punctuation is not stripped and lowers the score.
+
         Args:
             merchant (str): The normalized merchant name to look up.
             threshold (int, optional): The minimum score for a match to be considered valid. Defaults to 90.
@@ -36,15 +43,33 @@ class MerchantCategoryService:
         Returns:
             str | None: The best matching merchant name if found, otherwise None.
         """
-        from rapidfuzz import process
-
-        merchants = self.merchant_repo.get_all_merchants()
-        if not merchants:
+        merchant_keys = self.merchant_repo.get_merchant_keys()
+        if not merchant_keys:
             return None
 
-        merchant_keys = [m.merchant_key for m in merchants]
-
-        match = process.extractOne(merchant, merchant_keys, score_cutoff=threshold)
+        # Merchants sharing the first word are the likely matches, so score
+        # that small group before falling back to every known merchant
+        words = merchant.split(maxsplit=1)
+        if words:
+            candidates = self.merchant_repo.get_merchant_keys_by_first_token(words[0])
+            if candidates and len(candidates) < len(merchant_keys):
+                match = process.extractOne(
+                    merchant,
+                    candidates,
+                    scorer=fuzz.WRatio,
+                    processor=None,
+                    score_cutoff=threshold,
+                )
+                if match:
+                    return match[0]
+
+        match = process.extractOne(
+            merchant,
+            merchant_keys,
+            scorer=fuzz.WRatio,
+            processor=None,
+            score_cutoff=threshold,
+        )
         if match:
             return match[0]
         return None
@@ -59,12 +84,47 @@ class MerchantCategoryService:
         Returns:
             str: The category of the merchant.
         """
-        merchant = self.normalizer(description)
-
         # If the amount is positive, it's likely an income, so we can categorize it as "Income"
         if amount > 0:
             return "Income"
 
+        return self._categorize_normalized(self.normalizer(description))
+
+    def categorize_batch(self, descriptions: list[str], amounts: list[float]) -> list[str]:
+        """Categorizes many transactions at once, e.g. a whole statement import.
+
+        Each distinct normalized merchant is looked up (and fuzzy matched) only
+        once per batch, however often it repeats.
+
+        Args:
+            descriptions (list[str]): The raw descriptions of the transactions.
+            amounts (list[float]): The matching transaction amounts.
+
+        Returns:
+            list[str]: The category of each transaction, in input order.
+        """
+        merchants = [
+            None if amount > 0 else self.normalizer(description)
+            for description, amount in zip(descriptions, amounts)
+        ]
+        # Fetch every exact match in one query; _categorize_normalized then
+        # reads them from the repository cache
+        distinct = list(dict.fromkeys(m for m in merchants if m is not None))
+        self.merchant_repo.get_categories(distinct)
+
+        resolved: dict[str, str] = {}
+        categories = []
+        for merchant in merchants:
+            if merchant is None:
+                categories.append("Income")
+                continue
+            category = resolved.get(merchant)
+            if category is None:
+                category = resolved[merchant] = self._categorize_normalized(merchant)
+            categories.append(category)
+        return categories
+
+    def _categorize_normalized(self, merchant: str) -> str:
         # First try exact match
         merchant_category = self.merchant_repo.get_category(merchant)
         if merchant_category:
@@ -84,16 +144,20 @@ class MerchantCategoryService:
         transactions = self.transaction_repo.get_all_transactions_by_category(
             "Uncategorized"
         )
+        if not transactions:
+            return
 
-        # For each transaction, update the category if the normalized merchant matches the updated category
-        for transaction in transactions:
-            # Check if the normalized merchant matches the updated category's merchant key
-            category = self.categorize_merchant(
-                transaction.description, transaction.amount
-            )
-
-            # If the category is not "Uncategorized", update the transaction category
-            if category != "Uncategorized":
-                self.transaction_repo.update_transaction(
-                    transaction.id, {"category": category}
-                )
+        # Uncategorized rows repeat merchants, so resolve each one once
+        categories = self.categorize_batch(
+            [t.description for t in transactions], [t.amount for t in transactions]
+        )
+
+        # Collect an update for every transaction that now has a category
+        updates: list[tuple[int, dict]] = [
+            (transaction.id, {"category": category})
+            for transaction, category in zip(transactions, categories)
+            if category != "Uncategorized"
+        ]
+
+        # Write all recategorized rows in a single transaction
+        self.transaction_repo.bulk_update(updates)
@@ -1,3 +1,4 @@
+import functools
 import logging
 from typing import NamedTuple
 from datetime import date
@@ -30,9 +31,21 @@ class StatisticsService:
     def __init__(self, transaction_repo: TransactionRepository):
         self.transaction_repo = transaction_repo
 
+    def open_reader(self) -> "StatisticsService":
+        """
+        Returns a service reading through its own connection, for use from a
+        worker thread. Close it with close() when done.
+        """
+        return StatisticsService(self.transaction_repo.open_reader())
+
+    def close(self) -> None:
+        """Closes the repository connection if the repository owns it."""
+        self.transaction_repo.close()
+
     @staticmethod
+    @functools.cache
     def _get_month_date_range(year: int, month: int) -> tuple[date, date]:
-        """Helper to get start and end date for a given month."""
+        """Helper to get start and end date for a given month (memoized; dates are immutable)."""
         start_date = date(year, month, 1)
         if month == 12:
             end_date = date(year + 1, 1, 1)
@@ -42,31 +55,35 @@ class StatisticsService:
 
     def get_monthly_metrics(self, year: int, month: int) -> MonthlyMetrics:
         """
-        Get comprehensive monthly metrics by combining multiple repository queries.
+        Get comprehensive monthly metrics from one aggregate query plus the top category.
 
         Returns:
             MonthlyMetrics with net income, top spending category, and additional stats
         """
+        # Previous month calculations
+        if month == 1:
+            prev_year, prev_month = year - 1, 12
+        else:
+            prev_year, prev_month = year, month - 1
+
         start_date, end_date = self._get_month_date_range(year, month)
-        net_income = self.transaction_repo.get_monthly_net_income(start_date, end_date)
-        top_category_data = self.transaction_repo.get_spending_by_category(start_date, end_date)
-        top_category_data = top_category_data[0] if top_category_data else None
+        prev_start, prev_end = self._get_month_date_range(prev_year, prev_month)
+        net_income, total_expenses, transaction_count, prev_month_expenses = (
+            self.transaction_repo.get_monthly_metrics_bundle(
+                start_date, end_date, prev_start, prev_end
+            )
+        )
+
+        top_category_data = self.transaction_repo.get_top_spending_category(
+            start_date, end_date
+        )
 
         if top_category_data:
             top_category, top_spending = top_category_data
         else:
             top_category, top_spending = None, None
 
-        total_expenses = self.get_monthly_total_expense(year, month)
-        transaction_count = self.get_monthly_transaction_count(year, month)
-        avg_transaction = total_expenses / transaction_count if transaction_count > 0 else 0.0
-
-        # Previous month calculations
-        if month == 1:
-            prev_year, prev_month = year - 1, 12
-        else:
-            prev_year, prev_month = year, month - 1
-        prev_month_expenses = self.get_monthly_total_expense(prev_year, prev_month)
+        avg_transaction = total_expenses / max(transaction_count, 1)
 
         if prev_month_expenses > 0:
             month_over_month_pct = ((total_expenses - prev_month_expenses) / prev_month_expenses) * 100
@@ -86,6 +103,62 @@ class StatisticsService:
             month_over_month_pct=month_over_month_pct,
         )
 
+    def get_monthly_metrics_range(self, year: int, month: int, n: int) -> list[MonthlyMetrics]:
+        """
+        Get metrics for the n months ending at (year, month), oldest first.
+
+        Uses two grouped queries for the whole window instead of running
+        get_monthly_metrics once per month.
+
+        Returns:
+            List of MonthlyMetrics in chronological order
+        """
+        if n <= 0:
+            return []
+
+        # Include one extra month so the oldest entry has a previous month
+        months = []
+        y, m = year, month
+        for _ in range(n + 1):
+            months.append((y, m))
+            y, m = (y - 1, 12) if m == 1 else (y, m - 1)
+        months.reverse()
+
+        start_date, _ = self._get_month_date_range(*months[0])
+        _, end_date = self._get_month_date_range(year, month)
+        totals = self.transaction_repo.get_monthly_totals_range(start_date, end_date)
+        top_categories = self.transaction_repo.get_top_category_by_month(start_date, end_date)
+
+        result = []
+        no_data = (0.0, 0.0, 0)
+        prev_month_expenses = totals.get(f"{months[0][0]:04d}-{months[0][1]:02d}", no_data)[1]
+        for y, m in months[1:]:
+            year_month = f"{y:04d}-{m:02d}"
+            net_income, total_expenses, transaction_count = totals.get(year_month, no_data)
+            top_category, top_spending = top_categories.get(year_month, (None, None))
+            avg_transaction = total_expenses / max(transaction_count, 1)
+            if prev_month_expenses > 0:
+                month_over_month_pct = ((total_expenses - prev_month_expenses) / prev_month_expenses) * 100
+            else:
+                month_over_month_pct = None
+
+            result.append(
+                MonthlyMetrics(
+                    year=y,
+                    month=m,
+                    net_income=net_income,
+                    top_category=top_category,
+                    top_category_spending=top_spending,
+                    total_expenses=total_expenses,
+                    transaction_count=transaction_count,
+                    avg_transaction=avg_transaction,
+                    prev_month_expenses=prev_month_expenses,
+                    month_over_month_pct=month_over_month_pct,
+                )
+            )
+            prev_month_expenses = total_expenses
+        return result
+
     def get_spending_heatmap_data(self, year: int, month: int) -> dict[int, float]:
         """
         Get daily spending data formatted for heatmap visualization.
@@ -141,6 +214,15 @@ class StatisticsService:
         """
         return self.transaction_repo.get_daily_spending_for_year(year)
 
+    def get_yearly_heatmap_series(self, year: int) -> list[float]:
+        """
+        Get daily spending for a full year as one value per day.
+
+        Returns:
+            List of spending amounts indexed by day offset from Jan 1
+        """
+        return self.transaction_repo.get_daily_spending_series_for_year(year)
+
     def get_available_years(self) -> list[int]:
         """
         Get list of years with expense data, sorted descending.
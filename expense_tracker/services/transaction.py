@@ -23,13 +23,17 @@ class TransactionService:
         self.transaction_repo = transaction_repo
         self.merchant_service = merchant_service
 
-    def add_transaction(self, transaction: Transaction) -> Transaction:
+    def add_transaction(
+        self, transaction: Transaction, *, auto_categorize: bool = True
+    ) -> Transaction:
         """Add a transaction with auto-categorization.
 
         If the transaction's category is "Uncategorized", attempts to
-        categorize it via the merchant category service.
+        categorize it via the merchant category service. Callers that
+        already know the category can pass auto_categorize=False to skip
+        the merchant lookup entirely.
         """
-        if transaction.category == "Uncategorized":
+        if auto_categorize and transaction.category == "Uncategorized":
             category = self.merchant_service.categorize_merchant(
                 transaction.description, transaction.amount
             )
@@ -64,17 +68,20 @@ class TransactionService:
 
         Returns the number of transactions imported (skipping duplicates).
         """
-        imported = 0
+        to_insert: list[Transaction] = []
+        seen = self.transaction_repo.existing_transaction_keys(transactions)
         for transaction in transactions:
-            category = self.merchant_service.categorize_merchant(
-                transaction.description, transaction.amount
-            )
-            transaction = replace(transaction, category=category)
-            if self.transaction_repo.transaction_exists(transaction):
+            key = (transaction.date.isoformat(), transaction.amount, transaction.description)
+            if key in seen:
                 continue
-            self.transaction_repo.add_transaction(transaction)
-            imported += 1
-        return imported
+            seen.add(key)
+            to_insert.append(transaction)
+
+        # Statements repeat merchants, so categorize the whole batch at once
+        categories = self.merchant_service.categorize_batch(
+            [t.description for t in to_insert], [t.amount for t in to_insert]
+        )
+        return self.transaction_repo.add_transactions_bulk(to_insert, categories)
 
     def delete_transaction(self, transaction_id: int) -> None:
         self.transaction_repo.delete_transaction(transaction_id)
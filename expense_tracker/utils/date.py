@@ -1,11 +1,26 @@
 from datetime import date, datetime
+from functools import lru_cache
 
 def parse_date_from_str(raw_date) -> date:
     if isinstance(raw_date, date):
         return raw_date
+    if isinstance(raw_date, str):
+        return _parse_str(raw_date)
+    raise ValueError(f"Unsupported date format: {raw_date}")
+
+
+@lru_cache(maxsize=4096)
+def _parse_str(raw_date: str) -> date:
+    """Statements repeat the same date strings, so parsed results are cached."""
+    # Zero-padded ISO dates take the C fast path
+    if len(raw_date) == 10 and raw_date[4] == "-" and raw_date[7] == "-":
+        try:
+            return date.fromisoformat(raw_date)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y"):
         try:
             return datetime.strptime(raw_date, fmt).date()
-        except (ValueError, TypeError):
+        except ValueError:
             continue
-    raise ValueError(f"Unsupported date format: {raw_date}")
\ No newline at end of file
+    raise ValueError(f"Unsupported date format: {raw_date}")
@@ -1,5 +1,11 @@
 import re
 
+# Digits plus the # and * noise characters, removed in one pass
+STRIP_CHARS_RX = re.compile(r"[\d#*]+")
+STRIP_CHARS_TABLE = str.maketrans("", "", "0123456789#*")
+NOISE_WORDS_RX = re.compile(r"\b(?:PENDING|PENDI|MOBILE|PURCHASE)\b")
+STATE_LETTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
 
 def normalize_merchant(description: str) -> str:
     """Normalizing the description so that it can be matched against the merchant repository. This includes:
@@ -17,26 +23,29 @@ def normalize_merchant(description: str) -> str:
     """
     description = description.upper()
 
-    # Remove digits
-    description = re.sub(r"\d+", "", description)
-
-    # Remove just # and *
-    description = re.sub(r"[#*]", "", description)
+    # Remove digits, # and * (the regex also covers non-ASCII digits)
+    if description.isascii():
+        description = description.translate(STRIP_CHARS_TABLE)
+    else:
+        description = STRIP_CHARS_RX.sub("", description)
 
-    # Remove PENDI or PENDING
-    description = re.sub(r"\bPENDING\b", "", description).strip()
-    description = re.sub(r"\bPENDI\b", "", description).strip()
+    # Remove PENDING, PENDI, MOBILE and PURCHASE
+    description = NOISE_WORDS_RX.sub("", description)
 
-    # Remove MOBILE
-    description = re.sub(r"\bMOBILE\b", "", description).strip()
+    # Remove extra spaces
+    description = " ".join(description.split())
 
-    # Remove PURCHASE
-    description = re.sub(r"\bPURCHASE\b", "", description).strip()
+    # Remove common trailing for cities: a standalone two-letter word at the end
+    if (
+        len(description) >= 2
+        and description[-1] in STATE_LETTERS
+        and description[-2] in STATE_LETTERS
+        and (len(description) == 2 or not _is_word_char(description[-3]))
+    ):
+        description = description[:-2].rstrip()
 
-    # Remove common trailing for cities
-    description = re.sub(r"\b[A-Z]{2}\b$", "", description).strip()
+    return description
 
-    # Remove extra spaces
-    description = re.sub(r"\s+", " ", description).strip()
 
-    return description
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
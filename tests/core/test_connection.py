@@ -0,0 +1,61 @@
+import sqlite3
+
+import pytest
+
+from expense_tracker.core.connection import close_shared_connections, get_connection
+
+
+@pytest.fixture(autouse=True)
+def _close_shared_connections():
+    yield
+    close_shared_connections()
+
+
+def test_file_connection_is_shared_per_path(tmp_path):
+    db_path = str(tmp_path / "transactions.db")
+    first = get_connection(db_path)
+    second = get_connection(db_path)
+    other = get_connection(str(tmp_path / "merchant_categories.db"))
+
+    assert first is second
+    assert other is not first
+
+
+def test_memory_connection_is_never_shared():
+    first = get_connection(":memory:")
+    second = get_connection(":memory:")
+
+    assert first is not second
+    first.close()
+    second.close()
+
+
+def test_file_connection_is_tuned(tmp_path):
+    conn = get_connection(str(tmp_path / "tuned.db"))
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+
+
+def test_connection_uses_autocommit_mode():
+    conn = get_connection(":memory:")
+
+    assert conn.isolation_level is None
+    conn.execute("CREATE TABLE t (x)")
+    conn.execute("INSERT INTO t VALUES (1)")
+    assert not conn.in_transaction
+    conn.close()
+
+
+def test_close_shared_connections(tmp_path):
+    db_path = str(tmp_path / "transactions.db")
+    first = get_connection(db_path)
+
+    close_shared_connections()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        first.execute("SELECT 1")
+    second = get_connection(db_path)
+    assert second is not first
+    assert second.execute("SELECT 1").fetchone()[0] == 1
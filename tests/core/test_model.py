@@ -26,3 +26,11 @@ def test_merchant_category_creation():
     )
     assert mc.merchant_key == "amazon"
     assert mc.category == "Shopping"
+
+
+def test_models_are_slotted():
+    """Test that model instances carry no per-instance __dict__."""
+    t = Transaction(None, date(2023, 1, 1), 10.50, "Food", "Lunch")
+    mc = MerchantCategory("amazon", "Shopping")
+    assert not hasattr(t, "__dict__")
+    assert not hasattr(mc, "__dict__")
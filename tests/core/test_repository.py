@@ -1,11 +1,49 @@
+import sqlite3
 from datetime import date
 
 import pytest
 
+from expense_tracker.core.connection import close_shared_connections
 from expense_tracker.core.models import MerchantCategory, Transaction
 from expense_tracker.core.transaction_repository import TransactionRepository
+from expense_tracker.core import merchant_repository
 from expense_tracker.core.merchant_repository import MerchantCategoryRepository
 
+# Transaction dates shared across tests, built once at import
+D_2022_01_01 = date(2022, 1, 1)
+D_2023_01_01 = date(2023, 1, 1)
+D_2023_01_02 = date(2023, 1, 2)
+D_2023_01_03 = date(2023, 1, 3)
+D_2023_01_04 = date(2023, 1, 4)
+D_2023_01_05 = date(2023, 1, 5)
+D_2023_01_06 = date(2023, 1, 6)
+D_2023_01_10 = date(2023, 1, 10)
+D_2023_01_15 = date(2023, 1, 15)
+D_2023_01_16 = date(2023, 1, 16)
+D_2023_01_20 = date(2023, 1, 20)
+D_2023_02_01 = date(2023, 2, 1)
+D_2023_02_05 = date(2023, 2, 5)
+D_2023_02_10 = date(2023, 2, 10)
+D_2023_02_15 = date(2023, 2, 15)
+D_2023_03_01 = date(2023, 3, 1)
+D_2023_03_05 = date(2023, 3, 5)
+D_2023_03_10 = date(2023, 3, 10)
+D_2023_03_15 = date(2023, 3, 15)
+D_2023_05_10 = date(2023, 5, 10)
+D_2023_05_15 = date(2023, 5, 15)
+D_2023_05_25 = date(2023, 5, 25)
+D_2023_06_20 = date(2023, 6, 20)
+D_2024_01_15 = date(2024, 1, 15)
+D_2024_02_05 = date(2024, 2, 5)
+D_2024_02_15 = date(2024, 2, 15)
+
+# Shared January rows; repository writes never mutate the Transactions passed in
+LUNCH = Transaction(None, D_2023_01_01, 10.0, "Food", "Lunch")
+DINNER = Transaction(None, D_2023_01_01, 15.0, "Food", "Dinner")
+TAXI = Transaction(None, D_2023_01_01, 5.0, "Transport", "Taxi")
+ELECTRICITY = Transaction(None, D_2023_01_02, 20.0, "Utilities", "Electricity")
+JAN_TXNS = [LUNCH, DINNER, TAXI, ELECTRICITY]
+
 
 @pytest.fixture
 def in_memory_repo():
@@ -27,6 +65,24 @@ def in_memory_merchant_repo():
     repo.conn.close()
 
 
+@pytest.fixture
+def file_db_path(tmp_path):
+    """
+    Provides a database file path and closes its shared connection afterwards.
+    """
+    yield str(tmp_path / "expenses.db")
+    close_shared_connections()
+
+
+@pytest.fixture
+def jan_seeded_repo(in_memory_repo):
+    """
+    Provides an in-memory TransactionRepository seeded with JAN_TXNS.
+    """
+    in_memory_repo.add_many(JAN_TXNS)
+    return in_memory_repo
+
+
 def test_set_and_get_category(in_memory_merchant_repo):
     repo: MerchantCategoryRepository = in_memory_merchant_repo
     repo.set_category(MerchantCategory("Amazon", "Shopping"))
@@ -49,15 +105,160 @@ def test_get_non_existent_category(in_memory_merchant_repo):
     assert repo.get_category("Unknown") is None
 
 
+def test_get_category_cache_sees_updates(in_memory_merchant_repo):
+    repo: MerchantCategoryRepository = in_memory_merchant_repo
+    assert repo.get_category("Starbucks") is None
+
+    repo.set_category(MerchantCategory("Starbucks", "Coffee"))
+    merchant_category = repo.get_category("Starbucks")
+    assert merchant_category is not None
+    assert merchant_category.category == "Coffee"
+
+    repo.set_category(MerchantCategory("Starbucks", "Food"))
+    merchant_category = repo.get_category("Starbucks")
+    assert merchant_category is not None
+    assert merchant_category.category == "Food"
+
+
 def test_get_all_merchants(in_memory_merchant_repo):
     repo: MerchantCategoryRepository = in_memory_merchant_repo
     repo.set_category(MerchantCategory("MerchantA", "Category1"))
     repo.set_category(MerchantCategory("MerchantB", "Category2"))
     merchants = repo.get_all_merchants()
     assert len(merchants) == 2
-    merchant_keys = [m.merchant_key for m in merchants]
-    assert "MerchantA" in merchant_keys
-    assert "MerchantB" in merchant_keys
+    assert merchants["MerchantA"].category == "Category1"
+    assert merchants["MerchantB"].category == "Category2"
+
+
+def test_get_all_merchants_cache_sees_updates(in_memory_merchant_repo):
+    repo: MerchantCategoryRepository = in_memory_merchant_repo
+    repo.set_category(MerchantCategory("MerchantA", "Category1"))
+    assert set(repo.get_all_merchants()) == {"MerchantA"}
+
+    repo.set_category(MerchantCategory("MerchantA", "Category2"))
+    repo.set_category(MerchantCategory("MerchantB", "Category3"))
+    merchants = repo.get_all_merchants()
+
+    assert merchants["MerchantA"].category == "Category2"
+    assert merchants["MerchantB"].category == "Category3"
+
+
+def test_get_merchant_keys_cache_sees_new_merchants(in_memory_merchant_repo):
+    repo: MerchantCategoryRepository = in_memory_merchant_repo
+    assert repo.get_merchant_keys() == ()
+
+    repo.set_category(MerchantCategory("MerchantA", "Category1"))
+    assert repo.get_merchant_keys() == ("MerchantA",)
+
+    repo.set_category(MerchantCategory("MerchantA", "Category2"))
+    repo.set_category(MerchantCategory("MerchantB", "Category3"))
+    assert sorted(repo.get_merchant_keys()) == ["MerchantA", "MerchantB"]
+
+
+def test_get_merchant_keys_by_first_token(in_memory_merchant_repo):
+    repo: MerchantCategoryRepository = in_memory_merchant_repo
+    repo.set_category(MerchantCategory("STARBUCKS COFFEE", "Coffee"))
+    repo.set_category(MerchantCategory("STARBUCKS", "Coffee"))
+    assert sorted(repo.get_merchant_keys_by_first_token("STARBUCKS")) == [
+        "STARBUCKS",
+        "STARBUCKS COFFEE",
+    ]
+    assert repo.get_merchant_keys_by_first_token("TARGET") == ()
+
+    repo.set_category(MerchantCategory("TARGET", "Shopping"))
+    assert repo.get_merchant_keys_by_first_token("TARGET") == ("TARGET",)
+
+
+def test_merchant_caches_see_writes_from_another_repository(file_db_path):
+    first = MerchantCategoryRepository(file_db_path)
+    second = MerchantCategoryRepository(file_db_path)
+    assert first.get_category("TARGET") is None
+    assert first.get_merchant_keys() == ()
+
+    second.set_category(MerchantCategory("TARGET", "Shopping"))
+
+    assert first.get_category("TARGET") == MerchantCategory("TARGET", "Shopping")
+    assert first.get_merchant_keys() == ("TARGET",)
+    assert first.get_merchant_keys_by_first_token("TARGET") == ("TARGET",)
+
+
+def test_get_categories(in_memory_merchant_repo):
+    repo: MerchantCategoryRepository = in_memory_merchant_repo
+    repo.set_category(MerchantCategory("STARBUCKS", "Coffee"))
+    repo.set_category(MerchantCategory("TARGET", "Shopping"))
+
+    # Start cold so the lookup has to go to the database
+    repo._category_cache.clear()
+    assert repo.get_categories(["TARGET", "UNKNOWN", "STARBUCKS"]) == {
+        "TARGET": MerchantCategory("TARGET", "Shopping"),
+        "UNKNOWN": None,
+        "STARBUCKS": MerchantCategory("STARBUCKS", "Coffee"),
+    }
+    assert repo._category_cache["UNKNOWN"] is None
+
+
+def test_category_cache_is_bounded(in_memory_merchant_repo, monkeypatch):
+    repo: MerchantCategoryRepository = in_memory_merchant_repo
+    monkeypatch.setattr(merchant_repository, "CATEGORY_CACHE_SIZE", 2)
+    repo.set_category(MerchantCategory("STARBUCKS", "Coffee"))
+
+    assert repo.get_category("UNKNOWN") is None
+    assert repo.get_category("STARBUCKS") is not None
+    assert repo.get_categories(["TARGET"]) == {"TARGET": None}
+
+    # UNKNOWN was the least recently used entry
+    assert list(repo._category_cache) == ["STARBUCKS", "TARGET"]
+
+
+def test_scan_caches_see_writes_from_another_repository(file_db_path):
+    first = TransactionRepository(file_db_path)
+    second = TransactionRepository(file_db_path)
+    assert first.count_all_transactions() == 0
+    assert first.get_months_with_expenses() == []
+
+    second.add_transaction(LUNCH)
+    second.add_transaction(Transaction(None, D_2023_02_05, -20.0, "Food", "Snack"))
+
+    assert first.count_all_transactions() == 2
+    assert first.get_months_with_expenses() == [(2023, 2)]
+    assert first.get_latest_month_with_data() == (2023, 2)
+
+
+def test_open_reader_uses_own_connection_and_sees_commits(file_db_path):
+    writer = TransactionRepository(file_db_path)
+    reader = writer.open_reader()
+    assert reader.conn is not writer.conn
+    assert reader.count_all_transactions() == 0
+
+    writer.add_transactions_bulk(JAN_TXNS)
+
+    # The commit came from another connection; data_version invalidates
+    assert reader.count_all_transactions() == len(JAN_TXNS)
+    reader.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        reader.conn.execute("SELECT 1")
+    # The writer's shared connection is untouched
+    assert writer.count_all_transactions() == len(JAN_TXNS)
+
+
+def test_open_reader_on_memory_database_returns_self(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    assert repo.open_reader() is repo
+
+
+def test_scan_cache_drops_result_that_raced_with_write(file_db_path):
+    writer = TransactionRepository(file_db_path)
+    reader = writer.open_reader()
+
+    def stale_count():
+        # A write lands while the reader's query is in flight
+        count = reader.conn.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+        writer.add_transaction(LUNCH)
+        return count
+
+    assert reader._cached_scan("count", stale_count) == 0
+    assert reader.count_all_transactions() == 1
+    reader.close()
 
 
 def test_add_transaction(in_memory_repo):
@@ -103,74 +304,24 @@ def test_get_non_existent_transaction(in_memory_repo):
     assert transaction is None
 
 
-def test_get_all_transactions(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=10.0,
-            category="Food",
-            description="Lunch",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-02"),
-            amount=20.0,
-            category="Utilities",
-            description="Electricity",
-        )
-    )
+def test_get_all_transactions(jan_seeded_repo):
+    repo: TransactionRepository = jan_seeded_repo
     transactions = repo.get_all_transactions()
-    assert len(transactions) == 2
-    assert transactions[0].amount == 20.0  # Ordered by date DESC
-    assert transactions[1].amount == 10.0
-
+    assert len(transactions) == 4
+    # Ordered by date DESC, then most recently added first
+    assert [t.description for t in transactions] == [
+        "Electricity",
+        "Taxi",
+        "Dinner",
+        "Lunch",
+    ]
 
-def test_daily_summary(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=10.0,
-            category="Food",
-            description="Lunch",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=15.0,
-            category="Food",
-            description="Dinner",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=5.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-02"),
-            amount=20.0,
-            category="Utilities",
-            description="Electricity",
-        )
-    )
 
+def test_daily_summary(jan_seeded_repo):
+    repo: TransactionRepository = jan_seeded_repo
     summary = repo.daily_summary("2023-01-01")
     assert len(summary) == 2
-    categories = {row["category"]: row["total"] for row in summary}
+    categories = dict(summary)
     assert categories["Food"] == 25.0
     assert categories["Transport"] == 5.0
 
@@ -205,35 +356,7 @@ def test_delete_transaction(in_memory_repo):
 
 def test_delete_multiple_transactions(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    first = repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=10.0,
-            category="Food",
-            description="Lunch",
-        )
-    )
-    second = repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=15.0,
-            category="Food",
-            description="Dinner",
-        )
-    )
-    third = repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=5.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    assert first.id is not None and second.id is not None and third.id is not None
-    id1, id2, id3 = first.id, second.id, third.id
+    id1, id2, id3 = repo.add_many([LUNCH, DINNER, TAXI])
 
     # Test deleting multiple transactions
     deleted_rows = repo.delete_multiple_transactions([id1, id3])
@@ -253,6 +376,46 @@ def test_delete_multiple_transactions(in_memory_repo):
     assert len(repo.get_all_transactions()) == 1
 
 
+def test_delete_multiple_transactions_counts_only_deleted_rows(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    id1, id2, _ = repo.add_many([LUNCH, DINNER, TAXI])
+
+    # A repeated id and an unknown id delete nothing; search-index trigger
+    # writes are not counted either
+    assert repo.delete_multiple_transactions([id1, id1, id2, 9999]) == 2
+    assert repo.count_all_transactions() == 1
+
+
+@pytest.mark.parametrize("num_rows", [2, 100, 1000])
+def test_delete_multiple_transactions_batch(in_memory_repo, num_rows):
+    repo: TransactionRepository = in_memory_repo
+    ids = repo.add_many([LUNCH] * (num_rows + 1))
+
+    # Keep the last row so only the requested ids are deleted
+    assert repo.delete_multiple_transactions(ids[:-1]) == num_rows
+    assert repo.count_all_transactions() == 1
+    assert repo.get_transaction(ids[-1]) is not None
+
+
+def test_delete_multiple_transactions_beyond_variable_limit(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    saved = repo.add_transaction(
+        Transaction(
+            id=None,
+            date=D_2023_01_01,
+            amount=-5.0,
+            category="Food",
+            description="Snack",
+        )
+    )
+    assert saved.id is not None
+
+    # More ids than SQLite allows as bound parameters in a single statement
+    ids = [saved.id] + list(range(saved.id + 1, saved.id + 40_000))
+    assert repo.delete_multiple_transactions(ids) == 1
+    assert repo.count_all_transactions() == 0
+
+
 def test_update_transaction(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     saved = repo.add_transaction(
@@ -275,88 +438,99 @@ def test_update_transaction(in_memory_repo):
     assert updated_transaction.description == "Groceries"  # Should remain unchanged
 
 
-def test_count_all_transactions(in_memory_repo):
+def test_bulk_update(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    assert repo.count_all_transactions() == 0
-
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=10.0,
-            category="Food",
-            description="Lunch",
-        )
+    first_id, second_id = repo.add_many(
+        [
+            Transaction(None, D_2023_01_01, -10.0, "Uncategorized", "Coffee"),
+            Transaction(None, D_2023_01_02, -20.0, "Uncategorized", "Lunch"),
+        ]
     )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-02"),
-            amount=20.0,
-            category="Utilities",
-            description="Electricity",
-        )
+
+    repo.bulk_update(
+        [
+            (first_id, {"category": "Coffee"}),
+            (second_id, {"category": "Food", "date": date(2023, 1, 3)}),
+        ]
     )
-    assert repo.count_all_transactions() == 2
+
+    updated_first = repo.get_transaction(first_id)
+    updated_second = repo.get_transaction(second_id)
+    assert updated_first is not None and updated_second is not None
+    assert updated_first.category == "Coffee"
+    assert updated_second.category == "Food"
+    assert updated_second.date == date(2023, 1, 3)
+
+
+def test_bulk_update_empty(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.bulk_update([])
+    assert repo.count_all_transactions() == 0
+
+
+def test_count_all_transactions_empty(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    assert repo.count_all_transactions() == 0
+
+
+def test_count_all_transactions(jan_seeded_repo):
+    repo: TransactionRepository = jan_seeded_repo
+    assert repo.count_all_transactions() == 4
 
     saved = repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-03"),
+            date=D_2023_01_03,
             amount=30.0,
             category="Fun",
             description="Movies",
         )
     )
-    assert repo.count_all_transactions() == 3
+    assert repo.count_all_transactions() == 5
 
     repo.delete_transaction(saved.id)
-    assert repo.count_all_transactions() == 2
+    assert repo.count_all_transactions() == 4
 
 
 def test_search_by_keyword(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=-50.0,
-            category="Shopping",
-            description="AMAZON.COM",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-02"),
-            amount=-30.0,
-            category="Shopping",
-            description="Amazon Prime",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-03"),
-            amount=-20.0,
-            category="Food",
-            description="Walmart Grocery",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-04"),
-            amount=-15.0,
-            category="Food",
-            description="Target",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_01,
+                amount=-50.0,
+                category="Shopping",
+                description="AMAZON.COM",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_02,
+                amount=-30.0,
+                category="Shopping",
+                description="Amazon Prime",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_03,
+                amount=-20.0,
+                category="Food",
+                description="Walmart Grocery",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_04,
+                amount=-15.0,
+                category="Food",
+                description="Target",
+            ),
+        ]
     )
 
     # Search for "amazon" (case-insensitive)
     results = repo.search_by_keyword("amazon")
     assert len(results) == 2
-    assert all("amazon" in t.description.lower() for t in results)
+    assert {t.description for t in results} == {"AMAZON.COM", "Amazon Prime"}
     assert results[0].date > results[1].date  # Ordered by date DESC
 
     # Search for partial match
@@ -375,23 +549,23 @@ def test_search_by_keyword(in_memory_repo):
 
 def test_search_by_keyword_empty(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=-50.0,
-            category="Shopping",
-            description="Amazon",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-02"),
-            amount=-30.0,
-            category="Food",
-            description="Walmart",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_01,
+                amount=-50.0,
+                category="Shopping",
+                description="Amazon",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_02,
+                amount=-30.0,
+                category="Food",
+                description="Walmart",
+            ),
+        ]
     )
 
     # Empty keyword returns all transactions
@@ -406,8 +580,8 @@ def test_search_by_keyword_empty(in_memory_repo):
 def test_search_by_keyword_with_pagination(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add multiple Amazon transactions
-    for i in range(5):
-        repo.add_transaction(
+    repo.add_transactions_bulk(
+        [
             Transaction(
                 id=None,
                 date=date.fromisoformat(f"2023-01-0{i + 1}"),
@@ -415,7 +589,9 @@ def test_search_by_keyword_with_pagination(in_memory_repo):
                 category="Shopping",
                 description=f"Amazon order {i + 1}",
             )
-        )
+            for i in range(5)
+        ]
+    )
 
     # Get first page (limit 2)
     results = repo.search_by_keyword("amazon", limit=2, offset=0)
@@ -428,42 +604,178 @@ def test_search_by_keyword_with_pagination(in_memory_repo):
     assert results[0].description == "Amazon order 3"
 
 
-def test_count_search_results(in_memory_repo):
+def test_get_transactions_after_keyset_pagination(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-01"),
-            amount=-50.0,
-            category="Shopping",
-            description="AMAZON.COM",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-02"),
-            amount=-30.0,
-            category="Shopping",
-            description="Amazon Prime",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-03"),
-            amount=-20.0,
-            category="Food",
-            description="Walmart Grocery",
+    dates = ["2023-01-01", "2023-01-01", "2023-01-03", "2023-01-04", "2023-01-05"]
+    for i, d in enumerate(dates):
+        repo.add_transaction(
+            Transaction(
+                id=None,
+                date=date.fromisoformat(d),
+                amount=-10.0 * (i + 1),
+                category="Shopping",
+                description=f"Order {i + 1}",
+            )
         )
-    )
 
-    # Count amazon results
-    count = repo.count_search_results("amazon")
-    assert count == 2
+    first_page = repo.get_transactions_after(None, None, limit=2)
+    assert [t.description for t in first_page] == ["Order 5", "Order 4"]
 
-    # Count walmart results
-    count = repo.count_search_results("walmart")
+    last = first_page[-1]
+    second_page = repo.get_transactions_after(last.date.isoformat(), last.id, limit=2)
+    assert [t.description for t in second_page] == ["Order 3", "Order 2"]
+
+    # Rows sharing a date are split by id without skipping or repeating any
+    last = second_page[-1]
+    third_page = repo.get_transactions_after(last.date.isoformat(), last.id, limit=2)
+    assert [t.description for t in third_page] == ["Order 1"]
+
+
+def test_search_by_keyword_after_keyset_pagination(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=date.fromisoformat(f"2023-01-0{i + 1}"),
+                amount=-10.0 * (i + 1),
+                category="Shopping",
+                description=f"Amazon order {i + 1}" if i % 2 == 0 else "Walmart",
+            )
+            for i in range(5)
+        ]
+    )
+
+    first_page = repo.search_by_keyword_after("amazon", None, None, limit=2)
+    assert [t.description for t in first_page] == ["Amazon order 5", "Amazon order 3"]
+
+    last = first_page[-1]
+    second_page = repo.search_by_keyword_after(
+        "amazon", last.date.isoformat(), last.id, limit=2
+    )
+    assert [t.description for t in second_page] == ["Amazon order 1"]
+
+
+def test_search_index_follows_updates_and_deletes(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    saved = repo.add_transaction(
+        Transaction(
+            id=None,
+            date=D_2023_01_01,
+            amount=-12.0,
+            category="Food",
+            description="Chipotle Mexican Grill",
+        )
+    )
+    assert saved.id is not None
+    assert [t.id for t in repo.search_by_keyword("mexican")] == [saved.id]
+
+    repo.update_transaction(saved.id, {"description": "Panda Express"})
+    assert repo.search_by_keyword("mexican") == []
+    assert [t.id for t in repo.search_by_keyword("PANDA")] == [saved.id]
+
+    repo.delete_transaction(saved.id)
+    assert repo.count_search_results("panda") == 0
+
+
+def test_search_by_short_keyword(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transaction(
+        Transaction(
+            id=None,
+            date=D_2023_01_01,
+            amount=-3.0,
+            category="Food",
+            description="7-Eleven",
+        )
+    )
+
+    # Keywords shorter than a trigram still match as substrings
+    assert len(repo.search_by_keyword("7-")) == 1
+    assert repo.count_search_results("el") == 1
+
+
+@pytest.mark.parametrize(
+    "keyword, expected",
+    [
+        ("0%", ["50% OFF"]),
+        ("0% O", ["50% OFF"]),
+        ("_B", ["A_B"]),
+        ("A_B", ["A_B"]),
+        ("\\", ["C:\\TEMP"]),
+    ],
+    ids=["short_percent", "long_percent", "short_underscore", "long_underscore", "backslash"],
+)
+def test_search_treats_wildcards_literally(in_memory_repo, keyword, expected):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(None, D_2023_01_01, -1.0, "Misc", description)
+            for description in ["50% OFF", "500 OFF", "A_B", "AXB", "C:\\TEMP"]
+        ]
+    )
+
+    # Short keywords use LIKE and longer ones the trigram index; both are literal
+    assert [t.description for t in repo.search_by_keyword(keyword)] == expected
+    assert repo.count_search_results(keyword) == len(expected)
+
+
+def test_search_index_built_for_existing_rows(file_db_path):
+    db_path = file_db_path
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE transactions (
+            id INTEGER PRIMARY KEY,
+            date TEXT NOT NULL,
+            amount REAL NOT NULL,
+            category TEXT NOT NULL DEFAULT 'Uncategorized',
+            description TEXT
+        );
+        INSERT INTO transactions (date, amount, category, description)
+        VALUES ('2023-01-01', -9.99, 'Streaming', 'NETFLIX.COM');
+    """)
+    conn.close()
+
+    repo = TransactionRepository(db_path)
+    results = repo.search_by_keyword("netflix")
+
+    assert [t.description for t in results] == ["NETFLIX.COM"]
+
+
+def test_count_search_results(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_01,
+                amount=-50.0,
+                category="Shopping",
+                description="AMAZON.COM",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_02,
+                amount=-30.0,
+                category="Shopping",
+                description="Amazon Prime",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_03,
+                amount=-20.0,
+                category="Food",
+                description="Walmart Grocery",
+            ),
+        ]
+    )
+
+    # Count amazon results
+    count = repo.count_search_results("amazon")
+    assert count == 2
+
+    # Count walmart results
+    count = repo.count_search_results("walmart")
     assert count == 1
 
     # Count non-existent
@@ -482,50 +794,44 @@ def test_count_search_results(in_memory_repo):
 def test_get_daily_spending_for_month_with_data(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add expenses and income for January 2023
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=-50.0,  # Expense
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=-30.0,  # Another expense same day
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-100.0,  # Expense
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=500.0,  # Income (should be excluded)
-            category="Income",
-            description="Salary",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-02-10"),
-            amount=-25.0,  # Different month (should be excluded)
-            category="Food",
-            description="Lunch",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,  # Expense
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-30.0,  # Another expense same day
+                category="Transport",
+                description="Taxi",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-100.0,  # Expense
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=500.0,  # Income (should be excluded)
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_10,
+                amount=-25.0,  # Different month (should be excluded)
+                category="Food",
+                description="Lunch",
+            ),
+        ]
     )
 
     spending = repo.get_daily_spending_range(date(2023, 1, 1), date(2023, 2, 1))
@@ -543,7 +849,7 @@ def test_get_daily_spending_for_month_empty(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -559,23 +865,23 @@ def test_get_daily_spending_for_month_empty(in_memory_repo):
 def test_get_daily_spending_excludes_income(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add only income transactions
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=1000.0,  # Positive = income
-            category="Income",
-            description="Salary",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=500.0,  # Positive = income
-            category="Income",
-            description="Bonus",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=1000.0,  # Positive = income
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_10,
+                amount=500.0,  # Positive = income
+                category="Income",
+                description="Bonus",
+            ),
+        ]
     )
 
     spending = repo.get_daily_spending_range(date(2023, 1, 1), date(2023, 2, 1))
@@ -587,43 +893,41 @@ def test_get_daily_spending_excludes_income(in_memory_repo):
 
 def test_get_transactions_for_date_with_data(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    target = date.fromisoformat("2023-01-05")
+    target = D_2023_01_05
 
     # Add transactions on target date
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=target,
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=target,
-            amount=-30.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    # Add transaction on different date (should be excluded)
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-06"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=target,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=target,
+                amount=-30.0,
+                category="Transport",
+                description="Taxi",
+            ),
+            # Add transaction on different date (should be excluded)
+            Transaction(
+                id=None,
+                date=D_2023_01_06,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     transactions = repo.get_transactions_for_date(target)
 
     assert len(transactions) == 2
     # Verify all returned transactions have the target date
-    assert all(t.date == target for t in transactions)
+    assert {t.date for t in transactions} == {target}
 
 
 def test_get_transactions_for_date_empty(in_memory_repo):
@@ -632,7 +936,7 @@ def test_get_transactions_for_date_empty(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -640,51 +944,47 @@ def test_get_transactions_for_date_empty(in_memory_repo):
     )
 
     # Query for date with no transactions
-    transactions = repo.get_transactions_for_date(date.fromisoformat("2023-01-10"))
+    transactions = repo.get_transactions_for_date(D_2023_01_10)
     assert len(transactions) == 0
     assert transactions == []
 
 
 def test_get_transactions_for_date_ordering(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    target = date.fromisoformat("2023-01-05")
+    target = D_2023_01_05
 
     # Add transactions with different amounts
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=target,
-            amount=-10.0,
-            category="Food",
-            description="Snack",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=target,
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=target,
-            amount=-50.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=target,
-            amount=500.0,  # Income
-            category="Income",
-            description="Paycheck",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=target,
+                amount=-10.0,
+                category="Food",
+                description="Snack",
+            ),
+            Transaction(
+                id=None,
+                date=target,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=target,
+                amount=-50.0,
+                category="Transport",
+                description="Taxi",
+            ),
+            Transaction(
+                id=None,
+                date=target,
+                amount=500.0,  # Income
+                category="Income",
+                description="Paycheck",
+            ),
+        ]
     )
 
     transactions = repo.get_transactions_for_date(target)
@@ -700,51 +1000,45 @@ def test_get_transactions_for_date_ordering(in_memory_repo):
 def test_get_months_with_expenses(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add expenses across different months
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-03-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-20"),
-            amount=-30.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2024-02-05"),
-            amount=-75.0,
-            category="Food",
-            description="Restaurant",
-        )
-    )
-    # Add income (should be excluded)
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-02-01"),
-            amount=1000.0,
-            category="Income",
-            description="Salary",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_20,
+                amount=-30.0,
+                category="Transport",
+                description="Taxi",
+            ),
+            Transaction(
+                id=None,
+                date=D_2024_02_05,
+                amount=-75.0,
+                category="Food",
+                description="Restaurant",
+            ),
+            # Add income (should be excluded)
+            Transaction(
+                id=None,
+                date=D_2023_02_01,
+                amount=1000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     months = repo.get_months_with_expenses()
@@ -763,7 +1057,7 @@ def test_get_months_with_expenses_empty(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=1000.0,
             category="Income",
             description="Salary",
@@ -773,151 +1067,75 @@ def test_get_months_with_expenses_empty(in_memory_repo):
     months = repo.get_months_with_expenses()
 
     # Should return empty list (no expenses)
-    assert len(months) == 0
-    assert months == []
-
-
-def test_get_monthly_net_income_with_income_and_expenses(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    # Add income and expenses for January 2023
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=1000.0,  # Income
-            category="Income",
-            description="Salary",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=-50.0,  # Expense
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-25.0,  # Expense
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-20"),
-            amount=200.0,  # Income
-            category="Income",
-            description="Bonus",
-        )
-    )
-
-    net_income = repo.get_monthly_net_income(date(2023, 1, 1), date(2023, 2, 1))
-
-    # Net income = 1000 + 200 - 50 - 25 = 1125
-    assert net_income == 1125.0
-
-
-def test_get_monthly_net_income_only_expenses(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    # Add only expenses
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-50.0,
-            category="Food",
-            description="Restaurant",
-        )
-    )
-
-    net_income = repo.get_monthly_net_income(date(2023, 1, 1), date(2023, 2, 1))
-
-    # Net income = -100 - 50 = -150
-    assert net_income == -150.0
-
-
-def test_get_monthly_net_income_no_transactions(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    # Add transaction for different month
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-02-10"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-
-    # Query for month with no transactions
-    net_income = repo.get_monthly_net_income(date(2023, 1, 1), date(2023, 2, 1))
-
-    # Should return 0.0 for empty month
-    assert net_income == 0.0
+    assert len(months) == 0
+    assert months == []
 
 
-def test_get_monthly_net_income_only_income(in_memory_repo):
+@pytest.mark.parametrize(
+    "transactions, expected",
+    [
+        # Net income = 1000 + 200 - 50 - 25 = 1125
+        (
+            [
+                (D_2023_01_05, 1000.0, "Income", "Salary"),
+                (D_2023_01_10, -50.0, "Food", "Groceries"),
+                (D_2023_01_15, -25.0, "Transport", "Taxi"),
+                (D_2023_01_20, 200.0, "Income", "Bonus"),
+            ],
+            1125.0,
+        ),
+        # Net income = -100 - 50 = -150
+        (
+            [
+                (D_2023_01_10, -100.0, "Shopping", "Clothes"),
+                (D_2023_01_15, -50.0, "Food", "Restaurant"),
+            ],
+            -150.0,
+        ),
+        # Transactions in other months leave an empty month at 0.0
+        ([(D_2023_02_10, -50.0, "Food", "Groceries")], 0.0),
+        ([(D_2023_01_05, 2000.0, "Income", "Salary")], 2000.0),
+    ],
+    ids=["income_and_expenses", "only_expenses", "no_transactions", "only_income"],
+)
+def test_get_monthly_net_income(in_memory_repo, transactions, expected):
     repo: TransactionRepository = in_memory_repo
-    # Add only income
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
+    repo.add_transactions_bulk(
+        [Transaction(None, *transaction) for transaction in transactions]
     )
 
     net_income = repo.get_monthly_net_income(date(2023, 1, 1), date(2023, 2, 1))
 
-    assert net_income == 2000.0
+    assert net_income == expected
 
 
 def test_get_latest_month_with_data(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add transactions across different months
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-03-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2024-02-05"),
-            amount=-75.0,
-            category="Food",
-            description="Restaurant",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2024_02_05,
+                amount=-75.0,
+                category="Food",
+                description="Restaurant",
+            ),
+        ]
     )
 
     latest_year, latest_month = repo.get_latest_month_with_data()
@@ -942,41 +1160,37 @@ def test_get_latest_month_with_data_empty(in_memory_repo):
 def test_get_all_months_with_data(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add transactions across different months
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-20"),
-            amount=-30.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-03-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2024-02-05"),
-            amount=-75.0,
-            category="Food",
-            description="Restaurant",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_20,
+                amount=-30.0,
+                category="Transport",
+                description="Taxi",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2024_02_05,
+                amount=-75.0,
+                category="Food",
+                description="Restaurant",
+            ),
+        ]
     )
 
     months = repo.get_all_months_with_data()
@@ -989,6 +1203,32 @@ def test_get_all_months_with_data(in_memory_repo):
     assert (2024, 2) in months  # February 2024
 
 
+def test_month_lookups_refresh_after_writes(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    saved = repo.add_transaction(
+        Transaction(
+            id=None,
+            date=D_2023_01_15,
+            amount=-20.0,
+            category="Food",
+            description="Lunch",
+        )
+    )
+    assert saved.id is not None
+    assert repo.get_all_months_with_data() == {(2023, 1)}
+    assert repo.get_months_with_expenses() == [(2023, 1)]
+    assert repo.get_latest_month_with_data() == (2023, 1)
+
+    repo.update_transaction(saved.id, {"date": date(2023, 3, 2)})
+    assert repo.get_all_months_with_data() == {(2023, 3)}
+    assert repo.get_months_with_expenses() == [(2023, 3)]
+    assert repo.get_latest_month_with_data() == (2023, 3)
+
+    repo.delete_transaction(saved.id)
+    assert repo.get_all_months_with_data() == set()
+    assert repo.get_months_with_expenses() == []
+
+
 def test_get_all_months_with_data_empty(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # No transactions
@@ -1003,32 +1243,30 @@ def test_get_all_months_with_data_empty(in_memory_repo):
 def test_get_all_months_with_data_single_month(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add multiple transactions in the same month
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-05-10"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-05-15"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-05-25"),
-            amount=-30.0,
-            category="Transport",
-            description="Taxi",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_05_10,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_05_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_05_25,
+                amount=-30.0,
+                category="Transport",
+                description="Taxi",
+            ),
+        ]
     )
 
     months = repo.get_all_months_with_data()
@@ -1044,7 +1282,7 @@ def test_transaction_exists_returns_true_for_duplicate(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1054,7 +1292,7 @@ def test_transaction_exists_returns_true_for_duplicate(in_memory_repo):
     assert repo.transaction_exists(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1068,7 +1306,7 @@ def test_transaction_exists_returns_false_when_not_found(in_memory_repo):
     assert not repo.transaction_exists(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1076,12 +1314,41 @@ def test_transaction_exists_returns_false_when_not_found(in_memory_repo):
     )
 
 
+def test_existing_transaction_keys(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    for day, amount, description in [
+        ("2023-01-15", -50.0, "Groceries"),
+        ("2023-01-20", -20.0, "Coffee"),
+        ("2023-03-01", -10.0, "Outside range"),
+    ]:
+        repo.add_transaction(
+            Transaction(
+                id=None,
+                date=date.fromisoformat(day),
+                amount=amount,
+                category="Food",
+                description=description,
+            )
+        )
+
+    candidates = [
+        Transaction(None, date(2023, 1, 15), -50.0, "Food", "Groceries"),
+        Transaction(None, date(2023, 1, 20), -25.0, "Food", "Coffee"),
+        Transaction(None, date(2023, 2, 1), -10.0, "Food", "New"),
+    ]
+
+    assert repo.existing_transaction_keys(candidates) == {
+        ("2023-01-15", -50.0, "Groceries")
+    }
+    assert repo.existing_transaction_keys([]) == set()
+
+
 def test_transaction_exists_different_date(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1091,7 +1358,7 @@ def test_transaction_exists_different_date(in_memory_repo):
     assert not repo.transaction_exists(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-16"),
+            date=D_2023_01_16,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1104,7 +1371,7 @@ def test_transaction_exists_different_amount(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1114,7 +1381,7 @@ def test_transaction_exists_different_amount(in_memory_repo):
     assert not repo.transaction_exists(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-75.0,
             category="Food",
             description="Groceries",
@@ -1125,52 +1392,46 @@ def test_transaction_exists_different_amount(in_memory_repo):
 def test_get_daily_spending_for_year_with_data(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add expenses across different days in 2023
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-30.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-06-20"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    # Income should be excluded
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-03-01"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    # Different year should be excluded
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2024-01-15"),
-            amount=-75.0,
-            category="Food",
-            description="Restaurant",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-30.0,
+                category="Transport",
+                description="Taxi",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_06_20,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            # Income should be excluded
+            Transaction(
+                id=None,
+                date=D_2023_03_01,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+            # Different year should be excluded
+            Transaction(
+                id=None,
+                date=D_2024_01_15,
+                amount=-75.0,
+                category="Food",
+                description="Restaurant",
+            ),
+        ]
     )
 
     spending = repo.get_daily_spending_for_year(2023)
@@ -1188,35 +1449,55 @@ def test_get_daily_spending_for_year_empty(in_memory_repo):
     assert spending == {}
 
 
-def test_get_years_with_expenses(in_memory_repo):
+def test_get_daily_spending_series_for_year(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-05-10"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2024-02-15"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    # Income-only year should be excluded
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2022-01-01"),
-            amount=3000.0,
-            category="Income",
-            description="Salary",
+    for d, amount in [
+        ("2024-01-01", -20.0),
+        ("2024-01-01", -5.0),
+        ("2024-12-31", -40.0),
+        ("2024-03-01", 1000.0),  # income is excluded
+        ("2023-12-31", -99.0),  # other years are excluded
+    ]:
+        repo.add_transaction(
+            Transaction(None, date.fromisoformat(d), amount, "Food", "x")
         )
+
+    series = repo.get_daily_spending_series_for_year(2024)
+
+    assert len(series) == 366
+    assert series[0] == 25.0
+    assert series[365] == 40.0
+    assert sum(series) == 65.0
+    assert repo.get_daily_spending_series_for_year(2023)[364] == 99.0
+
+
+def test_get_years_with_expenses(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_05_10,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2024_02_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            # Income-only year should be excluded
+            Transaction(
+                id=None,
+                date=D_2022_01_01,
+                amount=3000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     years = repo.get_years_with_expenses()
@@ -1230,12 +1511,21 @@ def test_get_years_with_expenses_empty(in_memory_repo):
     assert years == []
 
 
+def test_get_years_with_expenses_sees_new_years(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transaction(Transaction(None, D_2023_01_15, -50.0, "Food", "Groceries"))
+    assert repo.get_years_with_expenses() == [2023]
+
+    repo.add_transaction(Transaction(None, D_2024_02_05, -75.0, "Food", "Restaurant"))
+    assert repo.get_years_with_expenses() == [2024, 2023]
+
+
 def test_transaction_exists_different_description(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1245,7 +1535,7 @@ def test_transaction_exists_different_description(in_memory_repo):
     assert not repo.transaction_exists(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-15"),
+            date=D_2023_01_15,
             amount=-50.0,
             category="Food",
             description="Restaurant",
@@ -1254,53 +1544,47 @@ def test_transaction_exists_different_description(in_memory_repo):
 
 
 def test_get_spending_by_category(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    # Add expenses in different categories
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=-100.0,
-            category="Groceries",
-            description="Whole Foods",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=-50.0,
-            category="Groceries",
-            description="Trader Joes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-75.0,
-            category="Restaurants",
-            description="Dinner",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-20"),
-            amount=-25.0,
-            category="Transportation",
-            description="Uber",
-        )
-    )
-    # Income should be excluded
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
+    repo: TransactionRepository = in_memory_repo
+    # Add expenses in different categories
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-100.0,
+                category="Groceries",
+                description="Whole Foods",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_10,
+                amount=-50.0,
+                category="Groceries",
+                description="Trader Joes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-75.0,
+                category="Restaurants",
+                description="Dinner",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_20,
+                amount=-25.0,
+                category="Transportation",
+                description="Uber",
+            ),
+            # Income should be excluded
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     result = repo.get_spending_by_category(date(2023, 1, 1), date(2023, 2, 1))
@@ -1312,22 +1596,15 @@ def test_get_spending_by_category(in_memory_repo):
     assert result[2] == ("Transportation", 25.0)
 
 
-def test_get_spending_by_category_empty(in_memory_repo):
-    repo: TransactionRepository = in_memory_repo
-    result = repo.get_spending_by_category(date(2023, 1, 1), date(2023, 2, 1))
-    assert result == []
-
-
-def test_get_spending_by_category_only_income(in_memory_repo):
+@pytest.mark.parametrize(
+    "transactions",
+    [[], [(D_2023_01_05, 2000.0, "Income", "Salary")]],
+    ids=["empty", "only_income"],
+)
+def test_get_spending_by_category_without_expenses(in_memory_repo, transactions):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
+    repo.add_transactions_bulk(
+        [Transaction(None, *transaction) for transaction in transactions]
     )
 
     result = repo.get_spending_by_category(date(2023, 1, 1), date(2023, 2, 1))
@@ -1337,24 +1614,24 @@ def test_get_spending_by_category_only_income(in_memory_repo):
 def test_get_spending_by_category_different_month_excluded(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add expense in January
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    # Add expense in February (should be excluded)
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-02-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            # Add expense in February (should be excluded)
+            Transaction(
+                id=None,
+                date=D_2023_02_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     result = repo.get_spending_by_category(date(2023, 1, 1), date(2023, 2, 1))
@@ -1363,36 +1640,69 @@ def test_get_spending_by_category_different_month_excluded(in_memory_repo):
     assert result[0] == ("Food", 50.0)
 
 
+@pytest.mark.parametrize(
+    "transactions, expected",
+    [
+        (
+            [
+                (D_2023_01_05, 2000.0, "Income", "Salary"),
+                (D_2023_01_10, -50.0, "Food", "Groceries"),
+                (D_2023_01_15, -80.0, "Shopping", "Clothes"),
+                (D_2023_01_20, -40.0, "Food", "Restaurant"),
+                (D_2023_02_10, -500.0, "Rent", "Rent"),
+            ],
+            ("Food", 90.0),
+        ),
+        (
+            [
+                (D_2023_01_05, -60.0, "Shopping", "Clothes"),
+                (D_2023_01_10, -60.0, "Food", "Groceries"),
+            ],
+            ("Food", 60.0),
+        ),
+        ([], None),
+        ([(D_2023_01_05, 2000.0, "Income", "Salary")], None),
+    ],
+    ids=["with_expenses", "tie", "empty", "only_income"],
+)
+def test_get_top_spending_category(in_memory_repo, transactions, expected):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [Transaction(None, *transaction) for transaction in transactions]
+    )
+
+    result = repo.get_top_spending_category(date(2023, 1, 1), date(2023, 2, 1))
+    assert result == expected
+
+
 def test_get_total_expense(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add expenses and income for January 2023
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    # Income should be excluded
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            # Income should be excluded
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     total = repo.get_total_expense(date(2023, 1, 1), date(2023, 2, 1))
@@ -1409,32 +1719,30 @@ def test_get_total_expense_no_data(in_memory_repo):
 
 def test_get_transaction_count(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     count = repo.get_transaction_count(date(2023, 1, 1), date(2023, 2, 1))
@@ -1449,39 +1757,76 @@ def test_get_transaction_count_no_data(in_memory_repo):
     assert count == 0
 
 
-def test_get_all_transactions_by_category(in_memory_repo):
+def test_get_monthly_metrics_bundle(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
+    for day, amount in [
+        ("2022-12-20", -40.0),
+        ("2022-12-31", 500.0),
+        ("2023-01-05", -50.0),
+        ("2023-01-10", -100.0),
+        ("2023-01-15", 2000.0),
+        ("2023-02-01", -75.0),
+    ]:
+        repo.add_transaction(
+            Transaction(
+                id=None,
+                date=date.fromisoformat(day),
+                amount=amount,
+                category="Misc",
+                description="Test",
+            )
         )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-10"),
-            amount=-30.0,
-            category="Food",
-            description="Restaurant",
+
+    net_income, total_expense, count, prev_total_expense = (
+        repo.get_monthly_metrics_bundle(
+            date(2023, 1, 1), date(2023, 2, 1), date(2022, 12, 1), date(2023, 1, 1)
         )
     )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+
+    assert net_income == 1850.0
+    assert total_expense == 150.0
+    assert count == 3
+    assert prev_total_expense == 40.0
+
+
+def test_get_monthly_metrics_bundle_no_data(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    assert repo.get_monthly_metrics_bundle(
+        date(2023, 1, 1), date(2023, 2, 1), date(2022, 12, 1), date(2023, 1, 1)
+    ) == (0.0, 0.0, 0, 0.0)
+
+
+def test_get_all_transactions_by_category(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_10,
+                amount=-30.0,
+                category="Food",
+                description="Restaurant",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     food_transactions = repo.get_all_transactions_by_category("Food")
     assert len(food_transactions) == 2
-    assert all(t.category == "Food" for t in food_transactions)
+    assert {t.category for t in food_transactions} == {"Food"}
     # Ordered by date DESC
     assert food_transactions[0].date > food_transactions[1].date
 
@@ -1490,12 +1835,30 @@ def test_get_all_transactions_by_category(in_memory_repo):
     assert shopping_transactions[0].description == "Clothes"
 
 
+def test_get_all_transactions_by_category_paginates(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None, date=d, amount=-10.0, category="Food", description="Lunch"
+            )
+            for d in (D_2023_01_05, D_2023_01_10, D_2023_01_15)
+        ]
+    )
+
+    first_page = repo.get_all_transactions_by_category("Food", limit=2)
+    assert [t.date for t in first_page] == [D_2023_01_15, D_2023_01_10]
+
+    second_page = repo.get_all_transactions_by_category("Food", limit=2, offset=2)
+    assert [t.date for t in second_page] == [D_2023_01_05]
+
+
 def test_get_all_transactions_by_category_empty(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1509,59 +1872,51 @@ def test_get_all_transactions_by_category_empty(in_memory_repo):
 def test_get_monthly_cashflow_trend_with_data(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
     # Add transactions across 3 months
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-05"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-01-15"),
-            amount=-500.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-02-05"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-02-15"),
-            amount=-800.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-03-05"),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date.fromisoformat("2023-03-15"),
-            amount=-300.0,
-            category="Food",
-            description="Lunch",
-        )
+    repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-500.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_05,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_15,
+                amount=-800.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_05,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_15,
+                amount=-300.0,
+                category="Food",
+                description="Lunch",
+            ),
+        ]
     )
 
     trend = repo.get_monthly_cashflow_trend(3)
@@ -1575,8 +1930,8 @@ def test_get_monthly_cashflow_trend_with_data(in_memory_repo):
 
 def test_get_monthly_cashflow_trend_limits_results(in_memory_repo):
     repo: TransactionRepository = in_memory_repo
-    for month in range(1, 7):
-        repo.add_transaction(
+    repo.add_transactions_bulk(
+        [
             Transaction(
                 id=None,
                 date=date(2023, month, 10),
@@ -1584,7 +1939,9 @@ def test_get_monthly_cashflow_trend_limits_results(in_memory_repo):
                 category="Food",
                 description="Groceries",
             )
-        )
+            for month in range(1, 7)
+        ]
+    )
 
     # Request only 3 most recent months
     trend = repo.get_monthly_cashflow_trend(3)
@@ -1607,7 +1964,7 @@ def test_get_all_transactions_pagination_offset_beyond_count(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1624,7 +1981,7 @@ def test_get_all_transactions_limit_zero(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Groceries",
@@ -1640,7 +1997,7 @@ def test_search_by_keyword_offset_beyond_count(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Shopping",
             description="Amazon Order",
@@ -1656,7 +2013,7 @@ def test_search_by_keyword_limit_zero(in_memory_repo):
     repo.add_transaction(
         Transaction(
             id=None,
-            date=date.fromisoformat("2023-01-05"),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Shopping",
             description="Amazon Order",
@@ -1665,3 +2022,111 @@ def test_search_by_keyword_limit_zero(in_memory_repo):
 
     result = repo.search_by_keyword("Amazon", limit=0, offset=0)
     assert result == []
+
+
+def test_file_database_uses_wal_journal(file_db_path):
+    repo = TransactionRepository(file_db_path)
+    journal_mode = repo.conn.execute("PRAGMA journal_mode").fetchone()[0]
+    synchronous = repo.conn.execute("PRAGMA synchronous").fetchone()[0]
+
+    assert journal_mode == "wal"
+    assert synchronous == 1  # NORMAL
+
+
+def test_expense_range_queries_use_partial_index(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    plan = repo.conn.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT category, SUM(ABS(amount)) FROM transactions
+        WHERE date BETWEEN ? AND ? AND amount < 0
+        GROUP BY category
+        """,
+        ("2024-01-01", "2024-01-31"),
+    ).fetchall()
+
+    assert any("COVERING INDEX ix_tx_expense_date" in row[3] for row in plan)
+
+
+def test_add_transactions_bulk(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    inserted = repo.add_transactions_bulk(
+        [
+            Transaction(None, date(2023, 1, 5), -5.0, "Coffee", "STARBUCKS"),
+            Transaction(None, date(2023, 1, 6), 100.0, "Income", "PAYROLL"),
+        ]
+    )
+
+    assert inserted == 2
+    assert repo.count_all_transactions() == 2
+    assert {t.description for t in repo.get_all_transactions()} == {
+        "STARBUCKS",
+        "PAYROLL",
+    }
+    assert repo.add_transactions_bulk([]) == 0
+
+
+def test_add_many_returns_ids_in_order(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    ids = repo.add_many(
+        [
+            Transaction(None, D_2023_01_05, -5.0, "Coffee", "STARBUCKS"),
+            Transaction(None, D_2023_01_06, 100.0, "Income", "PAYROLL"),
+        ]
+    )
+
+    assert [repo.get_transaction(i).description for i in ids] == [
+        "STARBUCKS",
+        "PAYROLL",
+    ]
+    assert repo.add_many([]) == []
+
+
+def test_add_transactions_bulk_refreshes_planner_stats(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [
+            Transaction(None, date(2023, 1, 1 + i % 28), -1.0, "Food", f"Item {i}")
+            for i in range(200)
+        ]
+    )
+
+    stats = repo.conn.execute(
+        "SELECT stat FROM sqlite_stat1 WHERE idx = 'ix_tx_date_id'"
+    ).fetchone()
+    assert stats is not None
+    assert stats[0].startswith("200 ")
+    assert not repo.conn.in_transaction
+
+
+def test_small_batches_leave_planner_stats_alone(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(JAN_TXNS)
+    repo.add_many(JAN_TXNS)
+
+    stats = repo.conn.execute(
+        "SELECT stat FROM sqlite_stat1 WHERE idx = 'ix_tx_date_id'"
+    ).fetchone()
+    assert stats is None
+
+
+def test_add_many_refreshes_planner_stats_and_resets_limit(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_many([LUNCH] * 150)
+
+    stats = repo.conn.execute(
+        "SELECT stat FROM sqlite_stat1 WHERE idx = 'ix_tx_date_id'"
+    ).fetchone()
+    assert stats is not None
+    assert stats[0].startswith("150 ")
+    assert repo.conn.execute("PRAGMA analysis_limit").fetchone()[0] == 0
+
+
+def test_add_transactions_bulk_with_categories(in_memory_repo):
+    repo: TransactionRepository = in_memory_repo
+    repo.add_transactions_bulk(
+        [Transaction(None, date(2023, 1, 5), -5.0, "Uncategorized", "STARBUCKS")],
+        ["Coffee"],
+    )
+
+    assert [t.category for t in repo.get_all_transactions()] == ["Coffee"]
@@ -95,6 +95,35 @@ def test_categorize_merchant_no_fuzzy_match_below_threshold(service, merchant_re
     assert category == "Uncategorized"
 
 
+def test_categorize_batch(service, merchant_repo):
+    """Batch categorization matches per-row results and keeps input order."""
+    merchant_repo.set_category(MerchantCategory("WHOLE FOODS", "Groceries"))
+    merchant_repo.set_category(MerchantCategory("STARBUCKS COFFEE", "Coffee"))
+    descriptions = ["Whole Foods", "STARBUCKS COFFE", "Employer", "Unknown Store", "Whole Foods"]
+    amounts = [-50.0, -5.0, 1000.0, -25.0, -12.0]
+
+    categories = service.categorize_batch(descriptions, amounts)
+
+    assert categories == ["Groceries", "Coffee", "Income", "Uncategorized", "Groceries"]
+    assert categories == [
+        service.categorize_merchant(d, a) for d, a in zip(descriptions, amounts)
+    ]
+
+
+def test_categorize_merchant_income_skips_normalization(merchant_repo, transaction_repo):
+    """Income rows should be categorized without normalizing the description."""
+    normalized = []
+
+    def normalizer(description):
+        normalized.append(description)
+        return normalize_merchant(description)
+
+    service = MerchantCategoryService(merchant_repo, transaction_repo, normalizer)
+
+    assert service.categorize_merchant("ACME PAYROLL", 2500.0) == "Income"
+    assert normalized == []
+
+
 # --- fuzzy_lookup_merchant ---
 
 
@@ -114,6 +143,24 @@ def test_fuzzy_lookup_returns_none_below_threshold(service, merchant_repo):
     assert result is None
 
 
+def test_fuzzy_lookup_prefers_same_first_word(service, merchant_repo):
+    """Should match among merchants sharing the first word, else fall back to all."""
+    merchant_repo.set_category(MerchantCategory("STARBUCKS COFFEE", "Coffee"))
+    merchant_repo.set_category(MerchantCategory("TRADER JOES", "Groceries"))
+
+    assert service.fuzzy_lookup_merchant("STARBUCKS COFFE") == "STARBUCKS COFFEE"
+    assert service.fuzzy_lookup_merchant("THE TRADER JOES") == "TRADER JOES"
+
+
+def test_fuzzy_lookup_punctuation_is_not_stripped(service, merchant_repo):
+    """Punctuation counts against the score, as with rapidfuzz's default processor."""
+    merchant_repo.set_category(MerchantCategory("AMAZON COM", "Shopping"))
+
+    # WRatio scores "AMAZON.COM" against "AMAZON COM" at 90, not 100
+    assert service.fuzzy_lookup_merchant("AMAZON.COM") == "AMAZON COM"
+    assert service.fuzzy_lookup_merchant("AMAZON.COM", threshold=91) is None
+
+
 def test_fuzzy_lookup_empty_merchants(service):
     """Should return None when no merchants exist in the repository."""
     result = service.fuzzy_lookup_merchant("STARBUCKS")
@@ -128,33 +175,31 @@ def test_update_uncategorized_transactions_recategorizes(
 ):
     """Should recategorize uncategorized transactions when a mapping exists."""
     # Add uncategorized transactions
-    transaction_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-50.0,
-            category="Uncategorized",
-            description="Whole Foods Market",
-        )
-    )
-    transaction_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 10),
-            amount=-30.0,
-            category="Uncategorized",
-            description="Target Store",
-        )
-    )
-    # Add a categorized transaction that should not be touched
-    transaction_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Amazon",
-        )
+    transaction_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=date(2023, 1, 5),
+                amount=-50.0,
+                category="Uncategorized",
+                description="Whole Foods Market",
+            ),
+            Transaction(
+                id=None,
+                date=date(2023, 1, 10),
+                amount=-30.0,
+                category="Uncategorized",
+                description="Target Store",
+            ),
+            # Add a categorized transaction that should not be touched
+            Transaction(
+                id=None,
+                date=date(2023, 1, 15),
+                amount=-100.0,
+                category="Shopping",
+                description="Amazon",
+            ),
+        ]
     )
 
     # Add a merchant mapping for Whole Foods
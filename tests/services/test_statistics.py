@@ -7,6 +7,22 @@ from expense_tracker.core.transaction_repository import TransactionRepository
 from expense_tracker.services.statistics import StatisticsService, MonthlyMetrics
 
 
+# Transaction dates shared across tests, built once at import
+D_2022_12_10 = date(2022, 12, 10)
+D_2022_12_20 = date(2022, 12, 20)
+D_2023_01_05 = date(2023, 1, 5)
+D_2023_01_10 = date(2023, 1, 10)
+D_2023_01_15 = date(2023, 1, 15)
+D_2023_01_20 = date(2023, 1, 20)
+D_2023_02_05 = date(2023, 2, 5)
+D_2023_02_10 = date(2023, 2, 10)
+D_2023_03_02 = date(2023, 3, 2)
+D_2023_03_15 = date(2023, 3, 15)
+D_2023_12_15 = date(2023, 12, 15)
+D_2024_01_05 = date(2024, 1, 5)
+D_2024_06_10 = date(2024, 6, 10)
+
+
 @pytest.fixture
 def in_memory_repo():
     """Provides an in-memory TransactionRepository for testing."""
@@ -21,44 +37,38 @@ def statistics_service(in_memory_repo):
     return StatisticsService(in_memory_repo)
 
 
-def test_get_monthly_metrics_with_data(in_memory_repo, statistics_service):
+@pytest.mark.parametrize(
+    "transactions, expected_net, expected_top, expected_top_spending",
+    [
+        # Net income = 2000 - 500 - 300 - 100; Groceries = 500 + 300
+        (
+            [
+                (D_2023_01_05, 2000.0, "Income", "Salary"),
+                (D_2023_01_10, -500.0, "Groceries", "Whole Foods"),
+                (D_2023_01_15, -300.0, "Groceries", "Trader Joes"),
+                (D_2023_01_20, -100.0, "Restaurants", "Dinner"),
+            ],
+            1100.0,
+            "Groceries",
+            800.0,
+        ),
+        ([], 0.0, None, None),
+        # No expenses, so no top category
+        ([(D_2023_01_05, 1500.0, "Income", "Salary")], 1500.0, None, None),
+    ],
+    ids=["with_data", "no_data", "only_income"],
+)
+def test_get_monthly_metrics(
+    in_memory_repo,
+    statistics_service,
+    transactions,
+    expected_net,
+    expected_top,
+    expected_top_spending,
+):
     """Test get_monthly_metrics returns correct combined data."""
-    # Add income and expenses for January 2023
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=2000.0,  # Income
-            category="Income",
-            description="Salary",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 10),
-            amount=-500.0,  # Expense - Groceries
-            category="Groceries",
-            description="Whole Foods",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=-300.0,  # Expense - Groceries
-            category="Groceries",
-            description="Trader Joes",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 20),
-            amount=-100.0,  # Expense - Restaurants
-            category="Restaurants",
-            description="Dinner",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [Transaction(None, *transaction) for transaction in transactions]
     )
 
     metrics = statistics_service.get_monthly_metrics(2023, 1)
@@ -66,70 +76,64 @@ def test_get_monthly_metrics_with_data(in_memory_repo, statistics_service):
     assert isinstance(metrics, MonthlyMetrics)
     assert metrics.year == 2023
     assert metrics.month == 1
-    assert metrics.net_income == 1100.0  # 2000 - 500 - 300 - 100
-    assert metrics.top_category == "Groceries"
-    assert metrics.top_category_spending == 800.0  # 500 + 300
-
-
-def test_get_monthly_metrics_no_data(statistics_service):
-    """Test get_monthly_metrics with no transactions."""
-    metrics = statistics_service.get_monthly_metrics(2023, 1)
-
-    assert metrics.year == 2023
-    assert metrics.month == 1
-    assert metrics.net_income == 0.0
-    assert metrics.top_category is None
-    assert metrics.top_category_spending is None
+    assert metrics.net_income == expected_net
+    assert metrics.top_category == expected_top
+    assert metrics.top_category_spending == expected_top_spending
 
 
-def test_get_monthly_metrics_only_income(in_memory_repo, statistics_service):
-    """Test get_monthly_metrics with only income (no expenses)."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=1500.0,
-            category="Income",
-            description="Salary",
-        )
+def test_get_monthly_metrics_range_matches_single_months(in_memory_repo, statistics_service):
+    """get_monthly_metrics_range should agree with get_monthly_metrics for each month."""
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(id=None, date=d, amount=amount, category=category, description="x")
+            for d, amount, category in [
+                (D_2022_12_20, -100.0, "Food"),
+                (D_2023_01_05, 2000.0, "Income"),
+                (D_2023_01_10, -500.0, "Groceries"),
+                (D_2023_01_15, -80.0, "Food"),
+                (D_2023_03_02, -250.0, "Rent"),
+                (D_2023_03_02, -250.0, "Bills"),
+            ]
+        ]
     )
 
-    metrics = statistics_service.get_monthly_metrics(2023, 1)
+    metrics = statistics_service.get_monthly_metrics_range(2023, 3, 4)
 
-    assert metrics.net_income == 1500.0
-    assert metrics.top_category is None  # No expenses
-    assert metrics.top_category_spending is None
+    assert [(m.year, m.month) for m in metrics] == [(2022, 12), (2023, 1), (2023, 2), (2023, 3)]
+    assert metrics == [statistics_service.get_monthly_metrics(m.year, m.month) for m in metrics]
+    assert metrics[1].top_category == "Groceries"
+    assert metrics[2].month_over_month_pct == -100.0
+    # Equal totals go to the alphabetically first category
+    assert metrics[3].top_category == "Bills"
 
 
 def test_get_spending_heatmap_data(in_memory_repo, statistics_service):
     """Test get_spending_heatmap_data returns daily spending."""
     # Add expenses for January 2023
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-50.0,
-            category="Food",
-            description="Lunch",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-30.0,
-            category="Transport",
-            description="Taxi",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Lunch",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-30.0,
+                category="Transport",
+                description="Taxi",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     heatmap_data = statistics_service.get_spending_heatmap_data(2023, 1)
@@ -143,100 +147,92 @@ def test_get_spending_heatmap_data(in_memory_repo, statistics_service):
 def test_get_available_months_all(in_memory_repo, statistics_service):
     """Test get_available_months returns all months with transactions."""
     # Add transactions for different months
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 2, 10),
-            amount=1000.0,  # Income only
-            category="Income",
-            description="Salary",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 3, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_10,
+                amount=1000.0,  # Income only
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     months = statistics_service.get_available_months(expenses_only=False)
 
-    assert len(months) == 3
-    assert (2023, 1) in months
-    assert (2023, 2) in months
-    assert (2023, 3) in months
+    # Unordered, so compare sorted
+    assert sorted(months) == [(2023, 1), (2023, 2), (2023, 3)]
 
 
 def test_get_available_months_expenses_only(in_memory_repo, statistics_service):
     """Test get_available_months with expenses_only filter."""
     # Add transactions for different months
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 2, 10),
-            amount=1000.0,  # Income only - should be excluded
-            category="Income",
-            description="Salary",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 3, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_10,
+                amount=1000.0,  # Income only - should be excluded
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     months = statistics_service.get_available_months(expenses_only=True)
 
-    assert len(months) == 2
-    assert (2023, 1) in months
-    assert (2023, 2) not in months  # Only income
-    assert (2023, 3) in months
+    # Most recent first; February has only income
+    assert months == [(2023, 3), (2023, 1)]
 
 
 def test_get_latest_available_month(in_memory_repo, statistics_service):
     """Test get_latest_available_month returns most recent month."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 3, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     year, month = statistics_service.get_latest_available_month()
@@ -257,23 +253,23 @@ def test_get_latest_available_month_empty(statistics_service):
 
 def test_get_yearly_heatmap_data(in_memory_repo, statistics_service):
     """Test get_yearly_heatmap_data returns daily spending keyed by ISO date."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 3, 15),
-            amount=-75.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 3, 15),
-            amount=-25.0,
-            category="Transport",
-            description="Taxi",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_03_15,
+                amount=-75.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_03_15,
+                amount=-25.0,
+                category="Transport",
+                description="Taxi",
+            ),
+        ]
     )
 
     data = statistics_service.get_yearly_heatmap_data(2023)
@@ -285,23 +281,23 @@ def test_get_yearly_heatmap_data(in_memory_repo, statistics_service):
 
 def test_get_available_years(in_memory_repo, statistics_service):
     """Test get_available_years returns years with expenses descending."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2024, 6, 10),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2024_06_10,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     years = statistics_service.get_available_years()
@@ -318,41 +314,37 @@ def test_get_available_years_empty(statistics_service):
 def test_get_cashflow_trend(in_memory_repo, statistics_service):
     """Test get_cashflow_trend returns monthly net amounts."""
     # Add transactions for multiple months
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 10),
-            amount=-500.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 2, 5),
-            amount=2000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 2, 10),
-            amount=-800.0,
-            category="Shopping",
-            description="Clothes",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_10,
+                amount=-500.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_05,
+                amount=2000.0,
+                category="Income",
+                description="Salary",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_02_10,
+                amount=-800.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+        ]
     )
 
     trend = statistics_service.get_cashflow_trend(num_months=2)
@@ -366,32 +358,30 @@ def test_get_cashflow_trend(in_memory_repo, statistics_service):
 
 def test_get_monthly_category_breakdown_with_data(in_memory_repo, statistics_service):
     """Test get_monthly_category_breakdown returns correct spending by category."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-200.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 20),
-            amount=3000.0,  # Income excluded
-            category="Income",
-            description="Salary",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-200.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_20,
+                amount=3000.0,  # Income excluded
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     result = statistics_service.get_monthly_category_breakdown(2023, 1)
@@ -409,24 +399,24 @@ def test_get_monthly_category_breakdown_empty(statistics_service):
 
 def test_get_monthly_category_breakdown_december(in_memory_repo, statistics_service):
     """Test get_monthly_category_breakdown handles December (year boundary)."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 12, 15),
-            amount=-150.0,
-            category="Gifts",
-            description="Holiday shopping",
-        )
-    )
-    # January next year should be excluded
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2024, 1, 5),
-            amount=-50.0,
-            category="Food",
-            description="Groceries",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_12_15,
+                amount=-150.0,
+                category="Gifts",
+                description="Holiday shopping",
+            ),
+            # January next year should be excluded
+            Transaction(
+                id=None,
+                date=D_2024_01_05,
+                amount=-50.0,
+                category="Food",
+                description="Groceries",
+            ),
+        ]
     )
 
     result = statistics_service.get_monthly_category_breakdown(2023, 12)
@@ -437,33 +427,31 @@ def test_get_monthly_category_breakdown_december(in_memory_repo, statistics_serv
 
 def test_get_monthly_total_expense(in_memory_repo, statistics_service):
     """Test get_monthly_total_expense delegates correctly to the repository."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-200.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    # Income should be excluded
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 20),
-            amount=3000.0,
-            category="Income",
-            description="Salary",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-200.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            # Income should be excluded
+            Transaction(
+                id=None,
+                date=D_2023_01_20,
+                amount=3000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     total = statistics_service.get_monthly_total_expense(2023, 1)
@@ -473,23 +461,23 @@ def test_get_monthly_total_expense(in_memory_repo, statistics_service):
 
 def test_get_monthly_transaction_count(in_memory_repo, statistics_service):
     """Test get_monthly_transaction_count delegates correctly to the repository."""
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-200.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=3000.0,
-            category="Income",
-            description="Salary",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-200.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=3000.0,
+                category="Income",
+                description="Salary",
+            ),
+        ]
     )
 
     count = statistics_service.get_monthly_transaction_count(2023, 1)
@@ -500,42 +488,38 @@ def test_get_monthly_transaction_count(in_memory_repo, statistics_service):
 def test_monthly_metrics_includes_new_fields(in_memory_repo, statistics_service):
     """Test that get_monthly_metrics returns all new fields populated correctly."""
     # Add expenses for January 2023
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 5),
-            amount=-200.0,
-            category="Food",
-            description="Groceries",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 15),
-            amount=-100.0,
-            category="Shopping",
-            description="Clothes",
-        )
-    )
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2023, 1, 20),
-            amount=3000.0,
-            category="Income",
-            description="Salary",
-        )
-    )
-    # Add expenses for December 2022 (previous month)
-    in_memory_repo.add_transaction(
-        Transaction(
-            id=None,
-            date=date(2022, 12, 10),
-            amount=-250.0,
-            category="Food",
-            description="Restaurant",
-        )
+    in_memory_repo.add_transactions_bulk(
+        [
+            Transaction(
+                id=None,
+                date=D_2023_01_05,
+                amount=-200.0,
+                category="Food",
+                description="Groceries",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_15,
+                amount=-100.0,
+                category="Shopping",
+                description="Clothes",
+            ),
+            Transaction(
+                id=None,
+                date=D_2023_01_20,
+                amount=3000.0,
+                category="Income",
+                description="Salary",
+            ),
+            # Add expenses for December 2022 (previous month)
+            Transaction(
+                id=None,
+                date=D_2022_12_10,
+                amount=-250.0,
+                category="Food",
+                description="Restaurant",
+            ),
+        ]
     )
 
     metrics = statistics_service.get_monthly_metrics(2023, 1)
@@ -552,7 +536,7 @@ def test_month_over_month_no_previous_data(statistics_service, in_memory_repo):
     in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 5),
+            date=D_2023_01_05,
             amount=-200.0,
             category="Food",
             description="Groceries",
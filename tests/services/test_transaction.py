@@ -10,6 +10,13 @@ from expense_tracker.services.transaction import TransactionService
 from expense_tracker.utils.merchant_normalizer import normalize_merchant
 
 
+# Transaction dates shared across tests, built once at import
+D_2023_01_05 = date(2023, 1, 5)
+D_2023_01_06 = date(2023, 1, 6)
+D_2023_01_10 = date(2023, 1, 10)
+D_2023_01_15 = date(2023, 1, 15)
+
+
 @pytest.fixture
 def in_memory_repo():
     repo = TransactionRepository(":memory:")
@@ -38,7 +45,7 @@ def test_add_transaction_auto_categorizes(transaction_service, merchant_repo):
 
     txn = Transaction(
         id=None,
-        date=date(2023, 1, 5),
+        date=D_2023_01_05,
         amount=-50.0,
         category="Uncategorized",
         description="WHOLE FOODS MARKET #123",
@@ -55,7 +62,7 @@ def test_add_transaction_preserves_explicit_category(transaction_service, mercha
 
     txn = Transaction(
         id=None,
-        date=date(2023, 1, 5),
+        date=D_2023_01_05,
         amount=-50.0,
         category="Food",
         description="WHOLE FOODS MARKET #123",
@@ -65,11 +72,27 @@ def test_add_transaction_preserves_explicit_category(transaction_service, mercha
     assert saved.category == "Food"
 
 
+def test_add_transaction_without_auto_categorize(transaction_service, merchant_repo):
+    """auto_categorize=False stores the transaction as given."""
+    merchant_repo.set_category(MerchantCategory("WHOLE FOODS", "Groceries"))
+
+    txn = Transaction(
+        id=None,
+        date=D_2023_01_05,
+        amount=-50.0,
+        category="Uncategorized",
+        description="WHOLE FOODS MARKET #123",
+    )
+    saved = transaction_service.add_transaction(txn, auto_categorize=False)
+
+    assert saved.category == "Uncategorized"
+
+
 def test_add_transaction_income_auto_categorized(transaction_service):
     """Positive amounts get categorized as Income."""
     txn = Transaction(
         id=None,
-        date=date(2023, 1, 5),
+        date=D_2023_01_05,
         amount=2000.0,
         category="Uncategorized",
         description="EMPLOYER DIRECT DEP",
@@ -83,7 +106,7 @@ def test_add_transaction_no_mapping_stays_uncategorized(transaction_service):
     """Transactions with no merchant mapping stay Uncategorized."""
     txn = Transaction(
         id=None,
-        date=date(2023, 1, 5),
+        date=D_2023_01_05,
         amount=-25.0,
         category="Uncategorized",
         description="RANDOM SHOP XYZ",
@@ -101,7 +124,7 @@ def test_update_transaction_updates_merchant_categories(
     txn1 = in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 5),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Uncategorized",
             description="WHOLE FOODS MARKET",
@@ -111,7 +134,7 @@ def test_update_transaction_updates_merchant_categories(
     txn2 = in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 10),
+            date=D_2023_01_10,
             amount=-30.0,
             category="Uncategorized",
             description="WHOLE FOODS",
@@ -135,7 +158,7 @@ def test_update_transaction_no_category_change(transaction_service, in_memory_re
     txn = in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 5),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Lunch",
@@ -161,7 +184,7 @@ def test_import_transactions_categorizes_and_deduplicates(
     in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 5),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Shopping",
             description="AMAZON.COM",
@@ -171,21 +194,21 @@ def test_import_transactions_categorizes_and_deduplicates(
     transactions = [
         Transaction(
             id=None,
-            date=date(2023, 1, 5),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Uncategorized",
             description="AMAZON.COM",
         ),
         Transaction(
             id=None,
-            date=date(2023, 1, 10),
+            date=D_2023_01_10,
             amount=-30.0,
             category="Uncategorized",
             description="AMAZON PRIME",
         ),
         Transaction(
             id=None,
-            date=date(2023, 1, 15),
+            date=D_2023_01_15,
             amount=2000.0,
             category="Uncategorized",
             description="EMPLOYER PAYROLL",
@@ -200,13 +223,36 @@ def test_import_transactions_categorizes_and_deduplicates(
     all_txns = in_memory_repo.get_all_transactions()
     assert len(all_txns) == 3  # 1 existing + 2 imported
 
-    # Find the Amazon Prime transaction
-    prime_txn = next(t for t in all_txns if "PRIME" in t.description)
-    assert prime_txn.category == "Shopping"
+    by_description = {t.description: t for t in all_txns}
+    assert by_description["AMAZON PRIME"].category == "Shopping"
+    assert by_description["EMPLOYER PAYROLL"].category == "Income"
+
+
+def test_import_transactions_deduplicates_within_batch(
+    transaction_service, in_memory_repo, merchant_repo, monkeypatch
+):
+    """Repeated rows in one import are stored once; merchants categorize once."""
+    merchant_repo.set_category(MerchantCategory("STARBUCKS", "Coffee"))
+    lookups = []
+    get_category = merchant_repo.get_category
+
+    def counting_get_category(merchant_key):
+        lookups.append(merchant_key)
+        return get_category(merchant_key)
+
+    monkeypatch.setattr(merchant_repo, "get_category", counting_get_category)
+
+    transactions = [
+        Transaction(None, D_2023_01_05, -5.0, "Uncategorized", "STARBUCKS"),
+        Transaction(None, D_2023_01_05, -5.0, "Uncategorized", "STARBUCKS"),
+        Transaction(None, D_2023_01_06, -6.0, "Uncategorized", "STARBUCKS #12"),
+    ]
+
+    imported = transaction_service.import_transactions(transactions)
 
-    # Find the income transaction
-    income_txn = next(t for t in all_txns if "PAYROLL" in t.description)
-    assert income_txn.category == "Income"
+    assert imported == 2
+    assert lookups == ["STARBUCKS"]
+    assert {t.category for t in in_memory_repo.get_all_transactions()} == {"Coffee"}
 
 
 def test_import_transactions_empty_list(transaction_service):
@@ -234,7 +280,7 @@ def test_delete_multiple_transactions(transaction_service, in_memory_repo):
     txn1 = in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 5),
+            date=D_2023_01_05,
             amount=-50.0,
             category="Food",
             description="Lunch",
@@ -243,7 +289,7 @@ def test_delete_multiple_transactions(transaction_service, in_memory_repo):
     txn2 = in_memory_repo.add_transaction(
         Transaction(
             id=None,
-            date=date(2023, 1, 10),
+            date=D_2023_01_10,
             amount=-30.0,
             category="Food",
             description="Dinner",
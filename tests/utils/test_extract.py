@@ -1,5 +1,7 @@
 from datetime import date
 
+import pytest
+
 from expense_tracker.utils.extract import (
     _parse_amount,
     parse_bofa_page,
@@ -7,16 +9,23 @@ from expense_tracker.utils.extract import (
 )
 from unittest.mock import patch, Mock
 
-def test_parse_amount():
-    assert _parse_amount("100.00") == 100.0
-    assert _parse_amount("$50.50") == 50.5
-    assert _parse_amount("1,000.00") == 1000.0
-    assert _parse_amount("($25.00)") == -25.0
-    assert _parse_amount("-10.00") == -10.0
-    assert _parse_amount("") == 0.0
-    assert _parse_amount("  $ 123.45  ") == 123.45
-    assert _parse_amount(" -5.00 ") == -5.00
-    assert _parse_amount("$1,234.56") == 1234.56
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("100.00", 100.0),
+        ("$50.50", 50.5),
+        ("1,000.00", 1000.0),
+        ("($25.00)", -25.0),
+        ("-10.00", -10.0),
+        ("", 0.0),
+        ("  $ 123.45  ", 123.45),
+        (" -5.00 ", -5.00),
+        ("$1,234.56", 1234.56),
+    ],
+)
+def test_parse_amount(s, expected):
+    assert _parse_amount(s) == expected
 
 
 def test_parse_bofa_page():
@@ -46,7 +46,8 @@ def mock_repo() -> MagicMock:
         return merchants.get(merchant)
 
     repo.get_category.side_effect = get_category
-    repo.get_all_merchants.return_value = list(merchants.values())
+    repo.get_all_merchants.return_value = merchants
+    repo.get_merchant_keys.return_value = tuple(merchants)
     return repo
 
 